@@ -180,6 +180,13 @@ class DAPIServerAdapter:
             self.trigger_event.before_change_sha, self.trigger_event.after_change_sha
         )
         self.yaml = YAML()
+        # Reuse connections across the Github and DAPI server API calls. Opened
+        # last, so a failure above leaves no session behind for the caller to close
+        self.session = requests.Session()
+
+    def close(self):
+        """Close the HTTP session shared by the API calls."""
+        self.session.close()
 
     def display_markdown_summary(self, message: str):
         """Set the message to be displayed on the DAPI Server."""
@@ -251,14 +258,14 @@ class DAPIServerAdapter:
             "User-Agent": "opendapi.org",
         }
         if is_post:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.trigger_event.repo_api_url}/{api_path}",
                 headers=headers,
                 json=json_payload,
                 timeout=30,
             )
         else:
-            response = requests.get(
+            response = self.session.get(
                 f"{self.trigger_event.repo_api_url}/{api_path}",
                 params=json_payload,
                 headers=headers,
@@ -320,7 +327,7 @@ class DAPIServerAdapter:
             "X-DAPI-Server-API-Key": self.dapi_server_config.api_key,
         }
 
-        response = requests.post(
+        response = self.session.post(
             urljoin(self.dapi_server_config.server_host, request_path),
             headers=headers,
             json=payload,
@@ -771,11 +778,14 @@ def dapi_ci(
         trigger_event=change_trigger_event,
     )
 
-    dapi_server_adapter.display_markdown_summary("# OpenDAPI CI")
-    dapi_server_adapter.display_markdown_summary(
-        "Here we will validate, register, and analyze the impact of changes to OpenDAPI files."
-    )
-    dapi_server_adapter.run()
+    try:
+        dapi_server_adapter.display_markdown_summary("# OpenDAPI CI")
+        dapi_server_adapter.display_markdown_summary(
+            "Here we will validate, register, and analyze the impact of changes to OpenDAPI files."
+        )
+        dapi_server_adapter.run()
+    finally:
+        dapi_server_adapter.close()
 
 
 if __name__ == "__main__":
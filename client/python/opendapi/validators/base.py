@@ -1,13 +1,13 @@
 """Validator class for DAPI and related files"""
+from collections.abc import Hashable
 from typing import Dict, List
 
+import functools
 import os
-import glob
 import json
 import requests
 
 from deepmerge import Merger, STRATEGY_END, extended_set
-from jsonschema import validate, ValidationError as JsonValidationError
 from ruamel.yaml import YAML
 
 from opendapi.defs import OPENDAPI_URL
@@ -45,14 +45,23 @@ class BaseValidator:
 
     SPEC_VERSION: str = NotImplemented
 
+    # Compiled schemas fetched so far, keyed by URL and shared by all validators
+    schema_cache: Dict[str, "jsonschema.protocols.Validator"] = {}
+
     def __init__(
         self,
         root_dir: str,
         enforce_existence: bool = False,
         should_autoupdate: bool = False,
     ):
-        self.schema_cache = {}
         self.yaml = YAML()
+        # Autoupdate writes the files back, so it loads them with the round-trip
+        # loader that keeps comments and ordering. Otherwise the files are only
+        # validated, so use the lighter safe loader. It is kept on the pure Python
+        # parser, as the C parser accepts different YAML than the round-trip one
+        self._yaml_loader = (
+            self.yaml if should_autoupdate else YAML(typ="safe", pure=True)
+        )
         self.root_dir = root_dir
         self.enforce_existence = enforce_existence
         self.should_autoupdate = should_autoupdate
@@ -75,8 +84,10 @@ class BaseValidator:
         """Get the base directory for the spec files"""
         return self.root_dir
 
-    def _get_merger(self):
-        """Get the merger object for deepmerge"""
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_merger(cls):
+        """Get the merger object for deepmerge, built once per validator class"""
 
         def _autoupdate_merge_strategy_for_dict_lists(config, path, base, nxt):
             """append items without duplicates in nxt to base and handles dict appropriately"""
@@ -84,28 +95,49 @@ class BaseValidator:
                 nxt and not isinstance(nxt[0], dict)
             ):
                 return STRATEGY_END
+            # Nothing to merge in, or to append, from an empty nxt
+            if not nxt:
+                return list(base)
+            # Index nxt once by each of its lookup values, keeping the first
+            # item seen per value, rather than scanning nxt for every base item
+            nxt_by_lookup_val = {}
+            for nxt_itm in nxt:
+                for key in cls.AUTOUPDATE_UNIQUE_LOOKUP_KEYS:
+                    lookup_val = nxt_itm.get(key)
+                    if lookup_val and isinstance(lookup_val, Hashable):
+                        nxt_by_lookup_val.setdefault(lookup_val, nxt_itm)
             result = []
             for idx, itm in enumerate(base):
-                lookup_vals = [
-                    itm.get(k) for k in self.AUTOUPDATE_UNIQUE_LOOKUP_KEYS if itm.get(k)
-                ]
-                filter_nxt_itms = [
-                    n
-                    for n in nxt
-                    if lookup_vals
-                    and [
-                        n.get(k)
-                        for k in self.AUTOUPDATE_UNIQUE_LOOKUP_KEYS
-                        if n.get(k) == lookup_vals[0]
-                    ]
-                ]
-                if filter_nxt_itms:
-                    result.append(
-                        config.value_strategy(path + [idx], itm, filter_nxt_itms[0])
+                # A base item is matched by its first set lookup value
+                lookup_val = next(
+                    (
+                        itm.get(k)
+                        for k in cls.AUTOUPDATE_UNIQUE_LOOKUP_KEYS
+                        if itm.get(k)
+                    ),
+                    None,
+                )
+                if isinstance(lookup_val, Hashable):
+                    nxt_itm = nxt_by_lookup_val.get(lookup_val)
+                else:
+                    # Unhashable values, e.g. dicts, are not indexed, so look
+                    # for the first equal one in nxt instead
+                    nxt_itm = next(
+                        (
+                            n
+                            for n in nxt
+                            if any(
+                                n.get(k) == lookup_val
+                                for k in cls.AUTOUPDATE_UNIQUE_LOOKUP_KEYS
+                            )
+                        ),
+                        None,
                     )
+                if nxt_itm is not None:
+                    result.append(config.value_strategy(path + [idx], itm, nxt_itm))
                 else:
                     result.append(itm)
-            if path in self.AUTOUPDATE_DISALLOW_NEW_ENTRIES_PATH:
+            if path in cls.AUTOUPDATE_DISALLOW_NEW_ENTRIES_PATH:
                 return result
             result_as_set = extended_set.ExtendedSet(result)
             return result + [n for n in nxt if n not in result_as_set]
@@ -130,10 +162,20 @@ class BaseValidator:
 
     def _get_files_for_suffix(self, suffixes: List[str]):
         """Get all files in the root directory with given suffixes"""
-        files = []
-        for suffix in suffixes:
-            files += glob.glob(f"{self.root_dir}/**/*{suffix}", recursive=True)
-        return files
+        # Walk the tree once for all suffixes, skipping hidden files and
+        # directories and grouping the files by suffix like a glob per suffix
+        files_by_suffix: Dict[str, List[str]] = {suffix: [] for suffix in suffixes}
+        for dir_path, dir_names, file_names in os.walk(self.root_dir, followlinks=True):
+            dir_names[:] = [name for name in dir_names if not name.startswith(".")]
+            for file_name in file_names:
+                if file_name.startswith("."):
+                    continue
+                for suffix in suffixes:
+                    if file_name.endswith(suffix):
+                        files_by_suffix[suffix].append(
+                            os.path.join(dir_path, file_name)
+                        )
+        return [file for suffix in suffixes for file in files_by_suffix[suffix]]
 
     def _get_file_contents_for_suffix(self, suffixes: List[str]):
         """Get the contents of all files in the root directory with given suffixes"""
@@ -142,13 +184,25 @@ class BaseValidator:
         for file in files:
             with open(file, "r", encoding="utf-8") as file_handle:
                 if file.endswith(".yaml") or file.endswith(".yml"):
-                    contents[file] = self.yaml.load(file_handle.read())
+                    contents[file] = self._yaml_loader.load(file_handle.read())
                 elif file.endswith(".json"):
                     contents[file] = json.load(file_handle)
                 else:
                     raise ValidationError(f"Unsupported file type for {file}")
         return contents
 
+    @staticmethod
+    def compile_schema(schema: Dict) -> "jsonschema.protocols.Validator":
+        """Check a JSON schema and compile it into a reusable validator"""
+        # jsonschema is slow to import and only needed when validating, which
+        # callers like dapi_ci that merely read the files never do
+        # pylint: disable=import-outside-toplevel
+        from jsonschema.validators import validator_for
+
+        validator_cls = validator_for(schema)
+        validator_cls.check_schema(schema)
+        return validator_cls(schema)
+
     def validate_existance(self):
         """Validate that the files exist"""
         if self.enforce_existence and not self.parsed_files:
@@ -162,26 +216,31 @@ class BaseValidator:
             raise ValidationError(f"Schema not found in {file}")
 
         jsonschema_ref = content["schema"]
-        if not jsonschema_ref.startswith(OPENDAPI_URL):
+        if not (
+            isinstance(jsonschema_ref, str) and jsonschema_ref.startswith(OPENDAPI_URL)
+        ):
             raise ValidationError(
                 f"Unsupported schema found at {jsonschema_ref} for "
                 f"{file} - not hosted on {OPENDAPI_URL}"
             )
-        try:
-            self.schema_cache[jsonschema_ref] = (
-                self.schema_cache.get(jsonschema_ref)
-                or requests.get(jsonschema_ref, timeout=2).json()
-            )
-        except requests.exceptions.RequestException as exc:
-            error_message = (
-                f"Error fetching schema {jsonschema_ref} for {file}: {str(exc)}"
-            )
-            raise ValidationError(error_message) from exc
-        try:
-            validate(content, self.schema_cache[jsonschema_ref])
-        except JsonValidationError as exc:
-            error_message = f"Validation error for {file}: \n{str(exc)}"
-            raise ValidationError(error_message) from exc
+        if jsonschema_ref not in self.schema_cache:
+            try:
+                schema = requests.get(jsonschema_ref, timeout=2).json()
+            except requests.exceptions.RequestException as exc:
+                error_message = (
+                    f"Error fetching schema {jsonschema_ref} for {file}: {str(exc)}"
+                )
+                raise ValidationError(error_message) from exc
+            self.schema_cache[jsonschema_ref] = self.compile_schema(schema)
+
+        # Same error selection as jsonschema.validate, without recompiling
+        # pylint: disable=import-outside-toplevel
+        from jsonschema.exceptions import best_match
+
+        error = best_match(self.schema_cache[jsonschema_ref].iter_errors(content))
+        if error is not None:
+            error_message = f"Validation error for {file}: \n{str(error)}"
+            raise ValidationError(error_message) from error
 
     def base_template_for_autoupdate(self) -> Dict[str, Dict]:
         """Set Autoupdate templates in {file_path: content} format"""
@@ -189,6 +248,8 @@ class BaseValidator:
 
     def autoupdate(self):
         """Autocreate or update the files"""
+        written = False
+        created_dirs = set()
         for file, base_content in self.base_template_for_autoupdate().items():
             self._assert_dapi_location_is_valid(file)
             content = base_content
@@ -207,13 +268,19 @@ class BaseValidator:
                     f"File {file} is not up to date and cannot be autoupdated during CI. "
                     f"Run OpenDAPI validators locally to update the file."
                 )
-            # Create the directory if it does not exist
+            # Create the directory if it does not exist, once per directory
             dir_name = os.path.dirname(file)
-            os.makedirs(dir_name, exist_ok=True)
+            if dir_name not in created_dirs:
+                os.makedirs(dir_name, exist_ok=True)
+                created_dirs.add(dir_name)
 
             with open(file, "w", encoding="utf-8") as file_handle:
                 self.yaml.dump(new_content, file_handle)
-        self.parsed_files = self._get_file_contents_for_suffix(self.SUFFIX)
+            written = True
+
+        # Only re-read the files from disk if any of them changed
+        if written:
+            self.parsed_files = self._get_file_contents_for_suffix(self.SUFFIX)
 
     def custom_content_validations(self, file: str, content: Dict):
         """Custom content validations if any desired"""
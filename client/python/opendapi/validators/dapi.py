@@ -139,6 +139,20 @@ class PynamodbDapiValidator(DapiValidator):
             return f"{self.base_dir_for_autoupdate()}/pynamodb/{table.Meta.table_name}.dapi.yaml"
     """
 
+    # DynamoDB attribute types mapped to DAPI data types
+    DYNAMO_TO_DAPI_DATATYPE: Dict[str, str] = {
+        "S": "string",
+        "N": "number",
+        "B": "binary",
+        "BOOL": "boolean",
+        "SS": "array",
+        "NS": "array",
+        "BS": "array",
+        "L": "array",
+        "M": "object",
+        "NULL": "null",
+    }
+
     def get_pynamo_tables(self) -> List["Model"]:
         """Get the Pynamo tables"""
         raise NotImplementedError
@@ -157,25 +171,12 @@ class PynamodbDapiValidator(DapiValidator):
 
     def _dynamo_type_to_dapi_datatype(self, dynamo_type: str) -> str:
         """Convert the DynamoDB type to DAPI data type"""
-        dynamo_to_dapi = {
-            "S": "string",
-            "N": "number",
-            "B": "binary",
-            "BOOL": "boolean",
-            "SS": "array",
-            "NS": "array",
-            "BS": "array",
-            "L": "array",
-            "M": "object",
-            "NULL": "null",
-        }
-        return dynamo_to_dapi.get(dynamo_type) or dynamo_type
+        return self.DYNAMO_TO_DAPI_DATATYPE.get(dynamo_type) or dynamo_type
 
     def build_fields_for_table(self, table: "Model") -> List[Dict]:
         """Build the fields for the table"""
-        attrs = table.get_attributes()
         fields = []
-        for _, attribute in attrs.items():
+        for attribute in table.get_attributes().values():
             fields.append(
                 {
                     "name": attribute.attr_name,
@@ -193,9 +194,8 @@ class PynamodbDapiValidator(DapiValidator):
 
     def build_primary_key_for_table(self, table: "Model") -> List[str]:
         """Build the primary key for the table"""
-        attrs = table.get_attributes()
         primary_key = []
-        for _, attribute in attrs.items():
+        for attribute in table.get_attributes().values():
             if attribute.is_hash_key:
                 primary_key.append(attribute.attr_name)
         return primary_key
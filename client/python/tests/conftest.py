@@ -1,9 +1,15 @@
 """Pytest configuration for the OpenDAPI Python client""" ""
+import glob
+import json
 import os
 
 import pytest
 from pytest_mock import MockFixture
 
+from opendapi.validators.base import BaseValidator
+
+SPEC_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "..", "docs", "spec")
+
 
 # Define a fixture for a temporary directory
 @pytest.fixture
@@ -19,7 +25,42 @@ def mock_requests_get(mocker: MockFixture):
     return mocker.patch("opendapi.validators.base.requests.get")
 
 
-@pytest.fixture
+@pytest.fixture(name="opendapi_spec_schemas", scope="session")
+def fixture_opendapi_spec_schemas():
+    """Return the published OpenDAPI schemas, keyed by their URL"""
+    schemas = {}
+    for spec_file in glob.glob(os.path.join(SPEC_DIR, "*", "*.json")):
+        with open(spec_file, "r", encoding="utf-8") as file_handle:
+            schema = json.load(file_handle)
+        schemas[schema["$id"]] = schema
+    return schemas
+
+
+@pytest.fixture(name="opendapi_schemas", scope="session")
+def fixture_opendapi_schemas(opendapi_spec_schemas):
+    """Return the published OpenDAPI schemas, compiled and keyed by their URL"""
+    return {
+        url: BaseValidator.compile_schema(schema)
+        for url, schema in opendapi_spec_schemas.items()
+    }
+
+
+@pytest.fixture(name="serve_opendapi_schemas")
+def fixture_serve_opendapi_schemas(requests_mock, opendapi_spec_schemas):
+    """Serve the published schemas locally and fail fast on any other HTTP call"""
+    for url, schema in opendapi_spec_schemas.items():
+        requests_mock.get(url, json=schema)
+    return requests_mock
+
+
+@pytest.fixture(autouse=True)
+def schema_cache(mocker: MockFixture, opendapi_schemas):
+    """Prime the validators' schema cache so tests don't fetch schemas"""
+    mocker.patch.dict(BaseValidator.schema_cache, opendapi_schemas, clear=True)
+    return BaseValidator.schema_cache
+
+
+@pytest.fixture(scope="session")
 def valid_teams():
     """Return a sample .teams.yaml file"""
     return {
@@ -43,7 +84,7 @@ def valid_teams():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_datastores():
     """Return a sample .datastores.yaml file"""
     return {
@@ -73,7 +114,7 @@ def valid_datastores():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_purposes():
     """Return a sample .purposes.yaml file"""
     return {
@@ -91,7 +132,7 @@ def valid_purposes():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def valid_dapi():
     """Return a sample .dapi.yaml file"""
     return {
@@ -1,7 +1,11 @@
-# pylint: disable=unused-argument, too-many-lines
+# pylint: disable=unused-argument, too-many-lines, too-many-arguments
 """Tests script/dapi_ci.py"""
+import contextlib
+import copy
+import dataclasses
+import io
 import json
-import os
+import re
 import subprocess
 from unittest import mock
 from typing import Dict, Tuple
@@ -25,8 +29,13 @@ from opendapi.validators.datastores import DatastoresValidator
 from opendapi.validators.purposes import PurposesValidator
 from opendapi.validators.teams import TeamsValidator
 
+# Keep this module on one xdist worker so its session fixtures are built once
+pytestmark = pytest.mark.xdist_group("dapi_ci")
 
-@pytest.fixture(name="sample_dapi_ci_server_config")
+
+# The config and trigger event fixtures are shared by the whole session;
+# derive variants with dataclasses.replace instead of mutating them
+@pytest.fixture(name="sample_dapi_ci_server_config", scope="session")
 def fixture_sample_dapi_ci_server_config():
     """Return a sample DAPI server config"""
     return DAPIServerConfig(
@@ -40,8 +49,8 @@ def fixture_sample_dapi_ci_server_config():
     )
 
 
-@pytest.fixture(name="sample_dapi_ci_trigger_push")
-def fixture_sample_dapi_ci_trigger_push(mocker):
+@pytest.fixture(name="sample_dapi_ci_trigger_push", scope="session")
+def fixture_sample_dapi_ci_trigger_push():
     """Return a sample DAPI CI trigger event"""
     return ChangeTriggerEvent(
         event_type="push",
@@ -54,7 +63,7 @@ def fixture_sample_dapi_ci_trigger_push(mocker):
     )
 
 
-@pytest.fixture(name="sample_dapi_ci_trigger_pull_request")
+@pytest.fixture(name="sample_dapi_ci_trigger_pull_request", scope="session")
 def fixture_sample_dapi_ci_trigger_pull_request():
     """Return a sample DAPI CI trigger event"""
     return ChangeTriggerEvent(
@@ -69,122 +78,185 @@ def fixture_sample_dapi_ci_trigger_pull_request():
     )
 
 
-@pytest.fixture(name="sample_opendapi_file_contents")
-def fixture_sample_opendapi_file_contents(
-    mocker, valid_teams, valid_dapi, valid_datastores, valid_purposes
+@pytest.fixture(name="shared_opendapi_files_data", scope="session")
+def fixture_shared_opendapi_files_data(
+    valid_teams, valid_dapi, valid_datastores, valid_purposes
 ):
-    """Return a sample OpenDAPI file contents"""
-    m_teams_files = {
-        "/path/to/repo/1.teams.yaml": valid_teams,
-        "/path/to/repo/2.teams.yaml": valid_teams,
-    }
-    mocker.patch.object(
-        TeamsValidator, "_get_file_contents_for_suffix", return_value=m_teams_files
-    )
-    m_dapis_files = {
-        "/path/to/repo/1.dapi.yaml": valid_dapi,
-        "/path/to/repo/2.dapi.yaml": valid_dapi,
-    }
-    mocker.patch.object(
-        DapiValidator, "_get_file_contents_for_suffix", return_value=m_dapis_files
-    )
-    m_datastores_files = {
-        "/path/to/repo/1.datastores.yaml": valid_datastores,
-        "/path/to/repo/2.datastores.yaml": valid_datastores,
-    }
-    mocker.patch.object(
-        DatastoresValidator,
-        "_get_file_contents_for_suffix",
-        return_value=m_datastores_files,
-    )
-    m_purposes_files = {
-        "/path/to/repo/1.purposes.yaml": valid_purposes,
-        "/path/to/repo/2.purposes.yaml": valid_purposes,
-    }
-    mocker.patch.object(
-        PurposesValidator,
-        "_get_file_contents_for_suffix",
-        return_value=m_purposes_files,
-    )
-
+    """Return the OpenDAPI file contents behind the session-wide mocks and adapters"""
     return OpenDAPIFileContents(
-        teams=m_teams_files,
-        dapis=m_dapis_files,
-        datastores=m_datastores_files,
-        purposes=m_purposes_files,
+        teams={
+            "/path/to/repo/1.teams.yaml": valid_teams,
+            "/path/to/repo/2.teams.yaml": valid_teams,
+        },
+        dapis={
+            "/path/to/repo/1.dapi.yaml": valid_dapi,
+            "/path/to/repo/2.dapi.yaml": valid_dapi,
+        },
+        datastores={
+            "/path/to/repo/1.datastores.yaml": valid_datastores,
+            "/path/to/repo/2.datastores.yaml": valid_datastores,
+        },
+        purposes={
+            "/path/to/repo/1.purposes.yaml": valid_purposes,
+            "/path/to/repo/2.purposes.yaml": valid_purposes,
+        },
         root_dir="/path/to/repo",
     )
 
 
-def mock_event(mocker, event_type: str):
-    """Mock the event"""
-    # update os.environ
-    os.environ["GITHUB_EVENT_NAME"] = event_type
-
-    event_json = {
-        "event_name": event_type,
-        "repository": {
-            "url": "https://api.github.com/opendapi",
-            "owner": {"login": "opendapi"},
-            "html_url": "https://github.com/opendapi",
-        },
-    }
-    if event_type == "push":
-        event_json.update(
-            {
-                "before": "before_sha",
-                "after": "after_sha",
-                "ref": "refs/heads/main",
-            }
+@pytest.fixture(name="opendapi_files_data")
+def fixture_opendapi_files_data(shared_opendapi_files_data):
+    """Return a copy of the OpenDAPI file contents that a test may modify"""
+    return copy.deepcopy(shared_opendapi_files_data)
+
+
+# Validator classes and the OpenDAPIFileContents attribute each one reads
+_VALIDATOR_CONTENTS = (
+    (TeamsValidator, "teams"),
+    (DapiValidator, "dapis"),
+    (DatastoresValidator, "datastores"),
+    (PurposesValidator, "purposes"),
+)
+
+
+# A repo without any OpenDAPI files, shared by the tests that need one
+_NO_FILES = OpenDAPIFileContents(
+    teams={}, dapis={}, datastores={}, purposes={}, root_dir="/path/to/repo"
+)
+
+
+@contextlib.contextmanager
+def _mocked_validators(opendapi_files_data: OpenDAPIFileContents):
+    """Serve the given contents from every validator, outside of mocker"""
+    with contextlib.ExitStack() as stack:
+        for validator_cls, contents_attr in _VALIDATOR_CONTENTS:
+            stack.enter_context(
+                mock.patch.object(
+                    validator_cls,
+                    "_get_file_contents_for_suffix",
+                    return_value=getattr(opendapi_files_data, contents_attr),
+                )
+            )
+        yield
+
+
+@pytest.fixture(name="mocked_validators", scope="module", autouse=True)
+def fixture_mocked_validators(shared_opendapi_files_data):
+    """Serve the shared OpenDAPI file contents from the validators for this module"""
+    with _mocked_validators(shared_opendapi_files_data):
+        yield
+
+
+@contextlib.contextmanager
+def _mocked_repo(opendapi_files_data: OpenDAPIFileContents):
+    """Mock the validators and git outside of a test's own mocker"""
+    with _mocked_validators(opendapi_files_data), mock.patch(
+        "subprocess.check_output",
+        side_effect=lambda cmd, *_, **unused: _GIT_OUTPUT_DIRTY.get(
+            " ".join(cmd[:2]), b""
+        ),
+    ):
+        yield
+
+
+@pytest.fixture(name="push_adapter", scope="session")
+def fixture_push_adapter(
+    shared_opendapi_files_data,
+    sample_dapi_ci_server_config,
+    sample_dapi_ci_trigger_push,
+):
+    """Return an adapter for a push event, shared by read-only tests"""
+    with _mocked_repo(shared_opendapi_files_data):
+        adapter = DAPIServerAdapter(
+            repo_root_dir="/path/to/repo",
+            dapi_server_config=sample_dapi_ci_server_config,
+            trigger_event=sample_dapi_ci_trigger_push,
         )
-    else:
-        event_json.update(
-            {
-                "pull_request": {
-                    "number": 123,
-                    "base": {
-                        "ref": "main",
-                        "sha": "before_sha",
-                    },
-                    "head": {
-                        "ref": "feature-branch",
-                        "sha": "after_sha",
-                    },
-                }
-            }
+    yield adapter
+    adapter.close()
+
+
+@pytest.fixture(name="pr_adapter", scope="session")
+def fixture_pr_adapter(
+    shared_opendapi_files_data,
+    sample_dapi_ci_server_config,
+    sample_dapi_ci_trigger_pull_request,
+):
+    """Return an adapter for a pull request event, shared by read-only tests"""
+    with _mocked_repo(shared_opendapi_files_data):
+        adapter = DAPIServerAdapter(
+            repo_root_dir="/path/to/repo",
+            dapi_server_config=sample_dapi_ci_server_config,
+            trigger_event=sample_dapi_ci_trigger_pull_request,
         )
-    mocker.patch("json.load", return_value=event_json)
-    return event_json
+    yield adapter
+    adapter.close()
+
+
+_EVENT_REPOSITORY = {
+    "url": "https://api.github.com/opendapi",
+    "owner": {"login": "opendapi"},
+    "html_url": "https://github.com/opendapi",
+}
+_PUSH_EVENT = {
+    "event_name": "push",
+    "repository": _EVENT_REPOSITORY,
+    "before": "before_sha",
+    "after": "after_sha",
+    "ref": "refs/heads/main",
+}
+_PULL_REQUEST_EVENT = {
+    "event_name": "pull_request",
+    "repository": _EVENT_REPOSITORY,
+    "pull_request": {
+        "number": 123,
+        "base": {
+            "ref": "main",
+            "sha": "before_sha",
+        },
+        "head": {
+            "ref": "feature-branch",
+            "sha": "after_sha",
+        },
+    },
+}
+
+
+def mock_event(mocker, monkeypatch, event_type: str):
+    """Mock the event"""
+    monkeypatch.setenv("GITHUB_EVENT_NAME", event_type)
+    event = _PUSH_EVENT if event_type == "push" else _PULL_REQUEST_EVENT
+    mocker.patch("opendapi.scripts.dapi_ci.json.load", return_value=event)
+    return event
 
 
-def mock_open(mocker, file_contents: str = ""):
-    """Mock open().read()"""
-    m_open = mocker.mock_open(read_data=file_contents)
-    mocker.patch("builtins.open", m_open)
-    return m_open
+def _stub_open(mocker, read_data: str = ""):
+    """Patch open() with a throwaway in-memory file holding read_data"""
 
+    def _open(file, *_, **unused):
+        file_handle = io.StringIO(read_data)
+        file_handle.name = file
+        return file_handle
 
-def mock_requests(
-    mocker, method: str, response_by_path_suffix: Dict[str, Tuple[int, Dict]]
+    mocker.patch("builtins.open", _open)
+
+
+def register_responses(
+    requests_mock, method: str, response_by_path_suffix: Dict[str, Tuple[int, Dict]]
 ):
-    """Mock requests.post()"""
-
-    def _get_response_for_path_suffix(url, *_, **unused):
-        """Return a response for the given path suffix"""
-        for path_suffix, response_tuple in response_by_path_suffix.items():
-            if url.endswith(path_suffix):
-                status_code = response_tuple[0]
-                response_json = response_tuple[1]
-                m_response = mocker.MagicMock()
-                m_response.status_code = status_code
-                m_response.json.return_value = response_json
-                return m_response
-        raise ValueError(f"No mock response found for url: {url}")
-
-    m_requests = mocker.MagicMock()
-    m_requests.side_effect = _get_response_for_path_suffix
-    mocker.patch(f"requests.{method}", m_requests)
-    return m_requests
+    """Register canned responses for the urls ending with the given paths"""
+    for path_suffix, (status_code, response_json) in response_by_path_suffix.items():
+        requests_mock.register_uri(
+            method.upper(),
+            re.compile(rf"{re.escape(path_suffix)}(\?.*)?$"),
+            status_code=status_code,
+            json=response_json,
+        )
+
+
+def count_requests(requests_mock, method: str) -> int:
+    """Count the requests made with the given method"""
+    return sum(1 for req in requests_mock.request_history if req.method == method)
 
 
 def mock_subprocess_check_output(mocker, cmd_prefix_to_response: Dict[str, str]):
@@ -192,11 +264,7 @@ def mock_subprocess_check_output(mocker, cmd_prefix_to_response: Dict[str, str])
 
     def _get_response_for_cmd_prefix(cmd, *_, **unused):
         """Return a response for the given cmd prefix"""
-        cmd_prefix = " ".join(cmd[:2])
-        for key, response in cmd_prefix_to_response.items():
-            if key == cmd_prefix:
-                return response
-        return b""
+        return cmd_prefix_to_response.get(" ".join(cmd[:2]), b"")
 
     m_subprocess = mocker.MagicMock()
     m_subprocess.side_effect = _get_response_for_cmd_prefix
@@ -204,37 +272,122 @@ def mock_subprocess_check_output(mocker, cmd_prefix_to_response: Dict[str, str])
     return m_subprocess
 
 
-@pytest.fixture(autouse=True)
-def setup(mocker, temp_directory):
-    """Mock some things"""
-    event_name = "push"
-    mocker.patch.dict(
-        os.environ,
+# git command outputs keyed by the first two words of the command
+_GIT_OUTPUT_DIRTY = {
+    "git diff": b"2.dapi.yaml\n2.teams.yaml\n2.datastores.yaml\n2.purposes.yaml\n",
+    "git rev-parse": b"current_branch",
+    "git status": b"something",
+}
+_GIT_OUTPUT_CLEAN = {**_GIT_OUTPUT_DIRTY, "git status": b""}
+
+
+_ENV = {
+    "DAPI_SERVER_HOST": "https://example.com",
+    "DAPI_SERVER_API_KEY": "your-api-key",
+    "MAINLINE_BRANCH_NAME": "main",
+    "REGISTER_ON_MERGE_TO_MAINLINE": "True",
+    "SUGGEST_CHANGES": "True",
+    "GITHUB_WORKSPACE": "/path/to/repo",
+    "GITHUB_TOKEN": "your-github-token",
+}
+
+
+# Server metadata shared by the DAPIServerResponse tests
+_CUSTOM_META = DAPIServerMeta(
+    name="custom-dapi-server",
+    url="https://opendapi.org",
+    github_user_name="github-user",
+    github_user_email="my_email",
+    logo_url="https://opendapi.org/logo.png",
+    suggestions_cta_url="https://opendapi.org/suggestions.png",
+)
+_OTHER_META = DAPIServerMeta(
+    name="other-dapi-server",
+    url="https://opendapi.org",
+    github_user_name="github-user",
+    github_user_email="my_email",
+)
+
+
+# Canned DAPI server and GitHub responses for the run() tests
+_RUN_POST_RESPONSES = {
+    "/validate": (
+        200,
         {
-            "DAPI_SERVER_HOST": "https://example.com",
-            "DAPI_SERVER_API_KEY": "your-api-key",
-            "MAINLINE_BRANCH_NAME": "main",
-            "REGISTER_ON_MERGE_TO_MAINLINE": "True",
-            "SUGGEST_CHANGES": "True",
-            "GITHUB_EVENT_NAME": event_name,
-            "GITHUB_WORKSPACE": "/path/to/repo",
-            "GITHUB_EVENT_PATH": f"{temp_directory}/trigger_event.json",
-            "GITHUB_STEP_SUMMARY": f"{temp_directory}/output.txt",
-            "GITHUB_TOKEN": "your-github-token",
+            "success": True,
+            "text": "Validation successful",
+            "md": "Validation successful",
         },
-    )
-
-    mock_event(mocker, event_name)
-    mock_subprocess_check_output(
-        mocker,
+    ),
+    "/register": (
+        200,
         {
-            "git diff": b"2.dapi.yaml\n2.teams.yaml\n"
-            b"2.datastores.yaml\n2.purposes.yaml\n",
-            "git rev-parse": b"current_branch",
-            "git status": b"something",
+            "success": True,
+            "text": "Registration successful",
+            "md": "Registration successful",
         },
-    )
-    yield
+    ),
+    "/impact": (
+        200,
+        {
+            "success": True,
+            "text": "Impact analysis successful",
+            "md": "Impact analysis successful",
+        },
+    ),
+    "/stats": (
+        200,
+        {
+            "success": True,
+            "text": "Stats retrieved successfully",
+            "md": "Stats retrieved successfully",
+        },
+    ),
+    "/pulls": (200, {"number": 1}),
+    "/comments": (200, {"success": True}),
+}
+_VALIDATE_WITH_SERVER_META = (
+    200,
+    {
+        "success": True,
+        "text": "Validation successful",
+        "md": "Validation successful",
+        "server_meta": dataclasses.asdict(_CUSTOM_META),
+    },
+)
+_VALIDATE_WITH_SUGGESTIONS = (
+    200,
+    {
+        "success": True,
+        "suggestions": {
+            "1.dapi.yaml": "suggestion1",
+            "2.dapi.yaml": "suggestion2",
+        },
+        "text": "Validation successful",
+        "md": "Validation successful",
+    },
+)
+_NO_OPEN_PULLS = {"/pulls": (200, [])}
+_OPEN_SUGGESTIONS_PULL = {"/pulls": (200, [{"number": 12, "body": "Suggestion"}])}
+
+
+@pytest.fixture(name="dapi_ci_env", scope="module", autouse=True)
+def fixture_dapi_ci_env(tmp_path_factory):
+    """Set the environment read by dapi_ci once for all tests in this module"""
+    output_dir = tmp_path_factory.mktemp("dapi_ci")
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        for key, value in _ENV.items():
+            monkeypatch.setenv(key, value)
+        monkeypatch.setenv("GITHUB_EVENT_NAME", "push")
+        monkeypatch.setenv("GITHUB_EVENT_PATH", f"{output_dir}/trigger_event.json")
+        monkeypatch.setenv("GITHUB_STEP_SUMMARY", f"{output_dir}/output.txt")
+        yield
+
+
+@pytest.fixture(autouse=True)
+def setup(mocker):
+    """Mock some things"""
+    mock_subprocess_check_output(mocker, _GIT_OUTPUT_DIRTY)
 
 
 def test_dapi_server_response():
@@ -244,14 +397,7 @@ def test_dapi_server_response():
     errors = {"loc_1": "error_1", "loc_2": "error_2"}
     response = DAPIServerResponse(
         status_code=200,
-        server_meta=DAPIServerMeta(
-            name="custom-dapi-server",
-            url="https://opendapi.org",
-            github_user_name="github-user",
-            github_user_email="my_email",
-            logo_url="https://opendapi.org/logo.png",
-            suggestions_cta_url="https://opendapi.org/suggestions.png",
-        ),
+        server_meta=_CUSTOM_META,
         text="error message",
         markdown="markdown message",
         info=info,
@@ -268,18 +414,20 @@ def test_dapi_server_response():
     other_errors = {"loc_3": "error_3"}
     other_response = DAPIServerResponse(
         status_code=404,
-        server_meta=DAPIServerMeta(
-            name="other-dapi-server",
-            url="https://opendapi.org",
-            github_user_name="github-user",
-            github_user_email="my_email",
-        ),
+        server_meta=_OTHER_META,
         text="error message2",
         markdown="markdown message",
         info=other_info,
         suggestions=other_suggestions,
         errors=other_errors,
     )
+    # merge() updates this response's dicts in place, so compute these first
+    merged_errors = errors.copy()
+    merged_errors.update(other_errors)
+    merged_info = info.copy()
+    merged_info.update(other_info)
+    merged_suggestions = suggestions.copy()
+    merged_suggestions.update(other_suggestions)
     merged_response = response.merge(other_response)
     assert merged_response.status_code == 404
     # OR of errors
@@ -289,9 +437,9 @@ def test_dapi_server_response():
     assert merged_response.server_meta.name == "other-dapi-server"
 
     # merge dicts of errors, info, suggestions
-    assert merged_response.errors == {**errors, **other_errors}
-    assert merged_response.info == {**info, **other_info}
-    assert merged_response.suggestions == {**suggestions, **other_suggestions}
+    assert merged_response.errors == merged_errors
+    assert merged_response.info == merged_info
+    assert merged_response.suggestions == merged_suggestions
     # if messages are equal, just show once
     assert merged_response.markdown == "markdown message"
     # if messages are different, show both
@@ -300,12 +448,7 @@ def test_dapi_server_response():
     # Test other edge cases
     other_response_2 = DAPIServerResponse(
         status_code=400,
-        server_meta=DAPIServerMeta(
-            name="other-dapi-server",
-            url="https://opendapi.org",
-            github_user_name="github-user",
-            github_user_email="my_email",
-        ),
+        server_meta=_OTHER_META,
         text=None,
         markdown="markdown message",
         info=None,
@@ -318,51 +461,41 @@ def test_dapi_server_response():
     assert merged_response.text == "error message"
 
 
-def test_dapi_server_adapter_init(
-    sample_dapi_ci_server_config, sample_dapi_ci_trigger_push
-):
+def test_dapi_server_adapter_init(push_adapter):
     """Test DAPIServerAdapter init"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
-    )
-    assert adapter.dapi_server_config.server_host == "https://example.com"
-    assert adapter.trigger_event.git_ref == "refs/heads/main"
-    assert adapter.repo_root_dir == "/path/to/repo"
+    assert push_adapter.dapi_server_config.server_host == "https://example.com"
+    assert push_adapter.trigger_event.git_ref == "refs/heads/main"
+    assert push_adapter.repo_root_dir == "/path/to/repo"
 
 
-def test_dapi_server_adapter_should_register(
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
-    sample_dapi_ci_trigger_pull_request,
+def test_dapi_server_adapter_init_fails_without_session(
+    mocker, sample_dapi_ci_server_config, sample_dapi_ci_trigger_push
 ):
-    """Test DAPIServerAdapter.should_register"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
+    """Test DAPIServerAdapter opens no session when its setup fails"""
+    m_session = mocker.patch("opendapi.scripts.dapi_ci.requests.Session")
+    mocker.patch.object(
+        DAPIServerAdapter,
+        "get_all_opendapi_files",
+        side_effect=RuntimeError("git failed"),
     )
-    assert adapter.should_register() is True
+    with pytest.raises(RuntimeError, match="git failed"):
+        DAPIServerAdapter(
+            repo_root_dir="/path/to/repo",
+            dapi_server_config=sample_dapi_ci_server_config,
+            trigger_event=sample_dapi_ci_trigger_push,
+        )
+    m_session.assert_not_called()
 
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_pull_request,
-    )
-    assert adapter.should_register() is False
 
+def test_dapi_server_adapter_should_register(push_adapter, pr_adapter):
+    """Test DAPIServerAdapter.should_register"""
+    assert push_adapter.should_register() is True
+    assert pr_adapter.should_register() is False
 
-def test_dapi_server_adapter_git_diff_filenames(
-    mocker, sample_dapi_ci_server_config, sample_dapi_ci_trigger_pull_request
-):
+
+def test_dapi_server_adapter_git_diff_filenames(mocker, pr_adapter):
     """Test DAPIServerAdapter.git_diff_filenames"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_pull_request,
-    )
-    filenames = adapter.git_diff_filenames("before_sha", "after_sha")
+    filenames = pr_adapter.git_diff_filenames("before_sha", "after_sha")
     assert filenames == [
         "2.dapi.yaml",
         "2.teams.yaml",
@@ -376,22 +509,12 @@ def test_dapi_server_adapter_git_diff_filenames(
         side_effect=subprocess.CalledProcessError(0, "Something went wrong"),
     )
     with pytest.raises(ClickException):
-        adapter.git_diff_filenames("before_sha", "after_sha")
+        pr_adapter.git_diff_filenames("before_sha", "after_sha")
 
 
-def test_dapi_server_adapter_get_changed_opendapi_files(
-    sample_opendapi_file_contents,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
-):
+def test_dapi_server_adapter_get_changed_opendapi_files(push_adapter):
     """Test DAPIServerAdapter.get_changed_opendapi_files"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
-    )
-
-    changed_files = adapter.get_changed_opendapi_files(
+    changed_files = push_adapter.get_changed_opendapi_files(
         before_change_sha="before_sha", after_change_sha="after_sha"
     )
 
@@ -402,16 +525,10 @@ def test_dapi_server_adapter_get_changed_opendapi_files(
     assert "/path/to/repo/2.purposes.yaml" in changed_files.purposes
 
 
-def test_ask_github_handles_400s(mocker):
+def test_ask_github_handles_400s(requests_mock, push_adapter):
     """Test DAPIServerAdapter.ask_github handles 400s"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=mock.MagicMock(),
-        trigger_event=mock.MagicMock(),
-    )
-
-    mock_requests(
-        mocker,
+    register_responses(
+        requests_mock,
         "post",
         {
             "/pulls": (404, {"message": "Not Found"}),
@@ -420,15 +537,16 @@ def test_ask_github_handles_400s(mocker):
     )
     with pytest.raises(ClickException):
         # 400s should raise SystemExit
-        adapter.ask_github("/pulls", {}, is_post=True)
+        push_adapter.ask_github("/pulls", {}, is_post=True)
 
     # 422s should not raise SystemExit
-    assert adapter.ask_github("/reviews", {}, is_post=True) == {
+    assert push_adapter.ask_github("/reviews", {}, is_post=True) == {
         "message": "Unprocessable Entity"
     }
 
 
 def test_create_suggestions_pull_request_writes_to_file(
+    requests_mock,
     mocker,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_pull_request,
@@ -442,16 +560,16 @@ def test_create_suggestions_pull_request_writes_to_file(
     m_yaml = mocker.MagicMock()
     m_yaml = mocker.patch.object(adapter.yaml, "dump")
     m_json = mocker.patch("json.dump")
-    mock_open(mocker)
-    mock_requests(
-        mocker,
+    _stub_open(mocker)
+    register_responses(
+        requests_mock,
         "post",
         {
             "/pulls": (200, {"number": 123}),
         },
     )
-    mock_requests(
-        mocker,
+    register_responses(
+        requests_mock,
         "get",
         {
             "/pulls": (200, [{"number": 2}]),
@@ -460,14 +578,7 @@ def test_create_suggestions_pull_request_writes_to_file(
     adapter.create_suggestions_pull_request(
         server_response=DAPIServerResponse(
             status_code=200,
-            server_meta=DAPIServerMeta(
-                name="custom-dapi-server",
-                url="https://opendapi.org",
-                github_user_name="github-user",
-                github_user_email="my_email",
-                logo_url="https://opendapi.org/logo.png",
-                suggestions_cta_url="https://opendapi.org/suggestions.png",
-            ),
+            server_meta=_CUSTOM_META,
             suggestions={
                 "2.dapi.yaml": {"a": "b"},
                 "2.dapi.json": {"c": "d"},
@@ -480,90 +591,98 @@ def test_create_suggestions_pull_request_writes_to_file(
     m_json.assert_called_once_with({"c": "d"}, mocker.ANY, indent=2)
 
 
-def test_dapi_server_adapter_validate(
-    mocker,
-    sample_opendapi_file_contents,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
-    sample_dapi_ci_trigger_pull_request,
-):
-    """Test DAPIServerAdapter.validate"""
-    sample_dapi_ci_server_config.validate_dapi_individually = False
-    for trigger_event in [
-        sample_dapi_ci_trigger_push,
-        sample_dapi_ci_trigger_pull_request,
-    ]:
-        adapter = DAPIServerAdapter(
-            repo_root_dir="/path/to/repo",
-            dapi_server_config=sample_dapi_ci_server_config,
-            trigger_event=trigger_event,
-        )
-
-        mock_post = mock_requests(
-            mocker,
-            "post",
+@pytest.mark.parametrize(
+    "endpoint, method_name, adapter_fixture, extra_payload, changed_only",
+    [
+        (
+            "/validate",
+            "validate",
+            "push_adapter",
+            # suggest changes only for pull requests
+            {"suggest_changes": False},
+            False,
+        ),
+        (
+            "/validate",
+            "validate",
+            "pr_adapter",
+            {"suggest_changes": True},
+            False,
+        ),
+        (
+            "/register",
+            "register",
+            "push_adapter",
             {
-                "/validate": (
-                    200,
-                    {
-                        "text": "Validation successful",
-                        "md": "Validation successful",
-                        "success": True,
-                    },
-                )
+                "commit_hash": "after_sha",
+                "source": "https://github.com/opendapi",
+                "unregister_missing_from_source": True,
             },
-        )
-        mock_post.reset_mock()
-        adapter.validate()
-
-        assert mock_post.called
-        _, kwargs = mock_post.call_args
-        expected = {
-            key: sample_opendapi_file_contents.for_server()[key]
-            for key in ["dapis", "teams", "datastores", "purposes"]
-        }
-        # suggest changes only for pull requests
-        assert kwargs["json"] == {
-            "suggest_changes": trigger_event.is_pull_request_event,
-            **expected,
-        }
-
-
-def test_dapi_server_adapter_validate_fails(
-    mocker,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
+            False,
+        ),
+        ("/impact", "analyze_impact", "push_adapter", {}, True),
+        ("/stats", "retrieve_stats", "push_adapter", {}, True),
+    ],
+)
+def test_dapi_server_adapter_requests(
+    requests_mock,
+    request,
+    opendapi_files_data,
+    endpoint,
+    method_name,
+    adapter_fixture,
+    extra_payload,
+    changed_only,
 ):
-    """Test DAPIServerAdapter.validate"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
+    """Test the DAPIServerAdapter methods that post OpenDAPI files"""
+    adapter = copy.copy(request.getfixturevalue(adapter_fixture))
+    adapter.dapi_server_config = dataclasses.replace(
+        adapter.dapi_server_config, validate_dapi_individually=False
+    )
+    register_responses(
+        requests_mock,
+        "post",
+        {
+            endpoint: (
+                200,
+                {
+                    "text": f"{method_name} successful",
+                    "md": f"{method_name} successful",
+                    "success": True,
+                },
+            )
+        },
     )
-    mock_post = mock_requests(
-        mocker,
+
+    resp = getattr(adapter, method_name)()
+    adapter.add_action_summary(resp)
+
+    assert requests_mock.called
+    expected_files = (
+        adapter.changed_files if changed_only else opendapi_files_data
+    ).for_server()
+    assert requests_mock.last_request.json() == {**extra_payload, **expected_files}
+
+
+def test_dapi_server_adapter_validate_fails(requests_mock, push_adapter):
+    """Test DAPIServerAdapter.validate"""
+    register_responses(
+        requests_mock,
         "post",
         {"/validate": (500, {})},
     )
     with pytest.raises(ClickException):
-        adapter.validate()
+        push_adapter.validate()
 
-    assert mock_post.called
+    assert requests_mock.called
 
 
 def test_dapi_server_adapter_validate_returns_error_message(
-    mocker,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
+    requests_mock, push_adapter
 ):
     """Test DAPIServerAdapter.validate"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
-    )
-    mock_post = mock_requests(
-        mocker,
+    register_responses(
+        requests_mock,
         "post",
         {
             "/validate": (
@@ -579,70 +698,15 @@ def test_dapi_server_adapter_validate_returns_error_message(
             )
         },
     )
-    resp = adapter.validate()
-    adapter.add_action_summary(resp)
-    assert mock_post.called
-
-
-def test_dapi_server_adapter_register(
-    mocker,
-    sample_opendapi_file_contents,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
-):
-    """Test DAPIServerAdapter.register"""
-
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
-    )
-    mock_post = mock_requests(
-        mocker,
-        "post",
-        {
-            "/register": (
-                200,
-                {
-                    "text": "Registration successful",
-                    "md": "Registration successful",
-                    "success": True,
-                },
-            )
-        },
-    )
-
-    resp = adapter.register()
-    adapter.add_action_summary(resp)
-
-    assert mock_post.called
-    _, kwargs = mock_post.call_args
-    expected = {
-        key: sample_opendapi_file_contents.for_server()[key]
-        for key in ["dapis", "teams", "datastores", "purposes"]
-    }
-    assert kwargs["json"] == {
-        "commit_hash": "after_sha",
-        "source": "https://github.com/opendapi",
-        "unregister_missing_from_source": True,
-        **expected,
-    }
+    resp = push_adapter.validate()
+    push_adapter.add_action_summary(resp)
+    assert requests_mock.called
 
 
-def test_dapi_server_adapter_register_only_when_appropriate(
-    mocker,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_pull_request,
-):
+def test_dapi_server_adapter_register_only_when_appropriate(requests_mock, pr_adapter):
     """Test DAPIServerAdapter.register"""
-
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_pull_request,
-    )
-    mock_post = mock_requests(
-        mocker,
+    register_responses(
+        requests_mock,
         "post",
         {
             "/register": (
@@ -656,85 +720,12 @@ def test_dapi_server_adapter_register_only_when_appropriate(
         },
     )
 
-    adapter.register()
-    mock_post.assert_not_called()
-
-
-def test_dapi_server_adapter_analyze_impact(
-    mocker,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
-):
-    """Test DAPIServerAdapter.analyze_impact"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
-    )
-    mock_post = mock_requests(
-        mocker,
-        "post",
-        {
-            "/impact": (
-                200,
-                {
-                    "text": "Impact analysis successful",
-                    "md": "Impact analysis successful",
-                    "success": True,
-                },
-            )
-        },
-    )
-    adapter.analyze_impact()
-
-    assert mock_post.called
-    _, kwargs = mock_post.call_args
-    assert kwargs["json"] == {
-        key: adapter.changed_files.for_server()[key]
-        for key in ["dapis", "teams", "datastores", "purposes"]
-    }
-
-
-def test_dapi_server_adapter_retrieve_stats(
-    mocker,
-    sample_dapi_ci_server_config,
-    sample_dapi_ci_trigger_push,
-):
-    """Test DAPIServerAdapter.retrieve_stats"""
-    adapter = DAPIServerAdapter(
-        repo_root_dir="/path/to/repo",
-        dapi_server_config=sample_dapi_ci_server_config,
-        trigger_event=sample_dapi_ci_trigger_push,
-    )
-
-    mock_post = mock_requests(
-        mocker,
-        "post",
-        {
-            "/stats": (
-                200,
-                {
-                    "text": "Stats retrieved successfully",
-                    "md": "Stats retrieved successfully",
-                    "success": True,
-                },
-            )
-        },
-    )
-
-    adapter.retrieve_stats()
-
-    assert mock_post.called
-    _, kwargs = mock_post.call_args
-    assert kwargs["json"] == {
-        key: adapter.changed_files.for_server()[key]
-        for key in ["dapis", "teams", "datastores", "purposes"]
-    }
+    pr_adapter.register()
+    assert not requests_mock.called
 
 
 def test_run_with_push_event(
-    mocker,
-    sample_opendapi_file_contents,
+    requests_mock,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_push,
 ):
@@ -744,57 +735,17 @@ def test_run_with_push_event(
         dapi_server_config=sample_dapi_ci_server_config,
         trigger_event=sample_dapi_ci_trigger_push,
     )
-    m_requests_post = mock_requests(
-        mocker,
-        "post",
-        {
-            "/validate": (
-                200,
-                {
-                    "success": True,
-                    "text": "Validation successful",
-                    "md": "Validation successful",
-                },
-            ),
-            "/register": (
-                200,
-                {
-                    "success": True,
-                    "text": "Registration successful",
-                    "md": "Registration successful",
-                },
-            ),
-            "/impact": (
-                200,
-                {
-                    "success": True,
-                    "text": "Impact analysis successful",
-                    "md": "Impact analysis successful",
-                    "error": True,
-                },
-            ),
-            "/stats": (
-                200,
-                {
-                    "success": True,
-                    "text": "Stats retrieved successfully",
-                    "md": "Stats retrieved successfully",
-                },
-            ),
-            "/pulls": (200, {"success": True}),
-            "/comments": (200, {"success": True}),
-        },
-    )
+    register_responses(requests_mock, "post", _RUN_POST_RESPONSES)
     adapter.run()
     # 1 call each to register, analyze_impact, retrieve_stats,
     # and 3 for validate (1 for non-dapis and 1 each for DAPIs)
     # because we validate each DAPI separately for latency reasons
-    assert m_requests_post.call_count == 6
+    assert count_requests(requests_mock, "POST") == 6
 
 
 def test_run_with_pull_request_event(
+    requests_mock,
     mocker,
-    sample_opendapi_file_contents,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_pull_request,
 ):
@@ -804,75 +755,26 @@ def test_run_with_pull_request_event(
         dapi_server_config=sample_dapi_ci_server_config,
         trigger_event=sample_dapi_ci_trigger_pull_request,
     )
-    mock_open(mocker, "")
-    m_requests_post = mock_requests(
-        mocker,
+    _stub_open(mocker)
+    register_responses(
+        requests_mock,
         "post",
-        {
-            "/validate": (
-                200,
-                {
-                    "success": True,
-                    "text": "Validation successful",
-                    "md": "Validation successful",
-                    "server_meta": {
-                        "name": "custom-dapi-server",
-                        "url": "https://opendapi.org",
-                        "github_user_name": "github-user",
-                        "github_user_email": "my_email",
-                        "logo_url": "https://opendapi.org/logo.png",
-                        "suggestions_cta_url": "https://opendapi.org/suggestions.png",
-                    },
-                },
-            ),
-            "/register": (
-                200,
-                {
-                    "success": True,
-                    "text": "Registration successful",
-                    "md": "Registration successful",
-                },
-            ),
-            "/impact": (
-                200,
-                {
-                    "success": True,
-                    "text": "Impact analysis successful",
-                    "md": "Impact analysis successful",
-                },
-            ),
-            "/stats": (
-                200,
-                {
-                    "success": True,
-                    "text": "Stats retrieved successfully",
-                    "md": "Stats retrieved successfully",
-                },
-            ),
-            "/pulls": (200, {"number": 1}),
-            "/comments": (200, {"success": True}),
-        },
-    )
-    m_requests_get = mock_requests(
-        mocker,
-        "get",
-        {
-            "/pulls": (200, []),
-        },
+        {**_RUN_POST_RESPONSES, "/validate": _VALIDATE_WITH_SERVER_META},
     )
+    register_responses(requests_mock, "get", _NO_OPEN_PULLS)
 
     adapter.run()
     # 1 call each to analyze_impact, retrieve_stats,
     # 3 for validate (1 for non-dapis and 1 each for DAPIs)
     # 2 to Github for creating a suggestions pull request and a comment on
     # no register because this is not a push event
-    assert m_requests_post.call_count == 7
-    assert m_requests_get.call_count == 1
+    assert count_requests(requests_mock, "POST") == 7
+    assert count_requests(requests_mock, "GET") == 1
 
 
 def test_run_with_pull_request_event_existing_suggestions_pr(
+    requests_mock,
     mocker,
-    sample_opendapi_file_contents,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_pull_request,
 ):
@@ -882,60 +784,15 @@ def test_run_with_pull_request_event_existing_suggestions_pr(
         dapi_server_config=sample_dapi_ci_server_config,
         trigger_event=sample_dapi_ci_trigger_pull_request,
     )
-    mock_open(mocker, "")
-    m_requests_post = mock_requests(
-        mocker,
+    _stub_open(mocker)
+    register_responses(
+        requests_mock,
         "post",
-        {
-            "/validate": (
-                200,
-                {
-                    "success": True,
-                    "suggestions": {
-                        "1.dapi.yaml": "suggestion1",
-                        "2.dapi.yaml": "suggestion2",
-                    },
-                    "text": "Validation successful",
-                    "md": "Validation successful",
-                },
-            ),
-            "/register": (
-                200,
-                {
-                    "success": True,
-                    "text": "Registration successful",
-                    "md": "Registration successful",
-                },
-            ),
-            "/impact": (
-                200,
-                {
-                    "success": True,
-                    "text": "Impact analysis successful",
-                    "md": "Impact analysis successful",
-                },
-            ),
-            "/stats": (
-                200,
-                {
-                    "success": True,
-                    "text": "Stats retrieved successfully",
-                    "md": "Stats retrieved successfully",
-                },
-            ),
-            "/pulls": (200, {"number": 1}),
-            "/comments": (200, {"success": True}),
-        },
+        {**_RUN_POST_RESPONSES, "/validate": _VALIDATE_WITH_SUGGESTIONS},
     )
 
     # Existing suggestion
-    m_requests_get = mock_requests(
-        mocker,
-        "get",
-        {
-            "/pulls": (200, [{"number": 12, "body": "Suggestion"}]),
-        },
-    )
+    register_responses(requests_mock, "get", _OPEN_SUGGESTIONS_PULL)
 
     adapter.run()
     # 1 call each to analyze_impact, retrieve_stats,
@@ -943,13 +800,13 @@ def test_run_with_pull_request_event_existing_suggestions_pr(
     # 1 to Github t add a comment
     # no github create PR because there is already one
     # no register because this is not a push event
-    assert m_requests_post.call_count == 6
-    assert m_requests_get.call_count == 1
+    assert count_requests(requests_mock, "POST") == 6
+    assert count_requests(requests_mock, "GET") == 1
 
 
 def test_run_with_pull_request_event_no_suggestions(
+    requests_mock,
     mocker,
-    sample_opendapi_file_contents,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_pull_request,
 ):
@@ -960,69 +817,16 @@ def test_run_with_pull_request_event_no_suggestions(
         trigger_event=sample_dapi_ci_trigger_pull_request,
     )
 
-    mock_open(mocker, "")
-    mock_subprocess_check_output(
-        mocker,
-        {
-            "git diff": b"2.dapi.yaml\n2.teams.yaml\n"
-            b"2.datastores.yaml\n2.purposes.yaml\n",
-            "git rev-parse": b"current_branch",
-            "git status": b"",
-        },
-    )
-    m_requests_post = mock_requests(
-        mocker,
+    _stub_open(mocker)
+    mock_subprocess_check_output(mocker, _GIT_OUTPUT_CLEAN)
+    register_responses(
+        requests_mock,
         "post",
-        {
-            "/validate": (
-                200,
-                {
-                    "success": True,
-                    "suggestions": {
-                        "1.dapi.yaml": "suggestion1",
-                        "2.dapi.yaml": "suggestion2",
-                    },
-                    "text": "Validation successful",
-                    "md": "Validation successful",
-                },
-            ),
-            "/register": (
-                200,
-                {
-                    "success": True,
-                    "text": "Registration successful",
-                    "md": "Registration successful",
-                },
-            ),
-            "/impact": (
-                200,
-                {
-                    "success": True,
-                    "text": "Impact analysis successful",
-                    "md": "Impact analysis successful",
-                },
-            ),
-            "/stats": (
-                200,
-                {
-                    "success": True,
-                    "text": "Stats retrieved successfully",
-                    "md": "Stats retrieved successfully",
-                },
-            ),
-            "/pulls": (200, {"number": 1}),
-            "/comments": (200, {"success": True}),
-        },
+        {**_RUN_POST_RESPONSES, "/validate": _VALIDATE_WITH_SUGGESTIONS},
     )
 
     # Existing suggestion
-    m_requests_get = mock_requests(
-        mocker,
-        "get",
-        {
-            "/pulls": (200, [{"number": 12, "body": "Suggestion"}]),
-        },
-    )
+    register_responses(requests_mock, "get", _OPEN_SUGGESTIONS_PULL)
 
     adapter.run()
     # 1 call each to analyze_impact, retrieve_stats,
@@ -1030,14 +834,14 @@ def test_run_with_pull_request_event_no_suggestions(
     # 1 to Github t add a comment
     # no github create PR because there is already one
     # no register because this is not a push event
-    assert m_requests_post.call_count == 6
+    assert count_requests(requests_mock, "POST") == 6
     # No call to get existing PRs for suggestions as there are no changes
-    assert m_requests_get.call_count == 0
+    assert count_requests(requests_mock, "GET") == 0
 
 
 def test_run_with_no_opendapi_files(
+    requests_mock,
     mocker,
-    sample_opendapi_file_contents,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_pull_request,
 ):
@@ -1045,13 +849,7 @@ def test_run_with_no_opendapi_files(
     mocker.patch.object(
         DAPIServerAdapter,
         "get_all_opendapi_files",
-        return_value=OpenDAPIFileContents(
-            teams={},
-            datastores={},
-            purposes={},
-            dapis={},
-            root_dir="/path/to/repo",
-        ),
+        return_value=_NO_FILES,
     )
     adapter = DAPIServerAdapter(
         repo_root_dir="/path/to/repo",
@@ -1059,19 +857,20 @@ def test_run_with_no_opendapi_files(
         trigger_event=sample_dapi_ci_trigger_pull_request,
     )
 
-    m_requests_post = mock_requests(
-        mocker,
+    register_responses(
+        requests_mock,
         "post",
         {},
     )
     adapter.run()
 
-    assert m_requests_post.call_count == 0
+    assert count_requests(requests_mock, "POST") == 0
 
 
 def test_run_with_no_changed_opendapi_files(
+    requests_mock,
     mocker,
-    sample_opendapi_file_contents,
+    opendapi_files_data,
     sample_dapi_ci_server_config,
     sample_dapi_ci_trigger_pull_request,
 ):
@@ -1079,54 +878,60 @@ def test_run_with_no_changed_opendapi_files(
     mocker.patch.object(
         DAPIServerAdapter,
         "get_all_opendapi_files",
-        return_value=sample_opendapi_file_contents,
+        return_value=opendapi_files_data,
     )
     mocker.patch.object(
         DAPIServerAdapter,
         "get_changed_opendapi_files",
-        return_value=OpenDAPIFileContents(
-            teams={},
-            datastores={},
-            purposes={},
-            dapis={},
-            root_dir="/path/to/repo",
-        ),
+        return_value=_NO_FILES,
     )
     adapter = DAPIServerAdapter(
         repo_root_dir="/path/to/repo",
         dapi_server_config=sample_dapi_ci_server_config,
         trigger_event=sample_dapi_ci_trigger_pull_request,
     )
-    m_requests_post = mock_requests(
-        mocker,
+    register_responses(
+        requests_mock,
         "post",
         {},
     )
     adapter.run()
 
-    assert m_requests_post.call_count == 0
+    assert count_requests(requests_mock, "POST") == 0
 
 
-def test_dapi_ci(mocker):
+def test_dapi_ci(mocker, monkeypatch):
     """Test the main function"""
     m_adapter_run = mocker.patch.object(DAPIServerAdapter, "run")
-    m_open = mocker.mock_open(read_data="dummy")
-    mocker.patch("builtins.open", m_open)
+    m_adapter_close = mocker.spy(DAPIServerAdapter, "close")
+    mock_event(mocker, monkeypatch, "push")
+    _stub_open(mocker, read_data="dummy")
     runner = CliRunner()
     result = runner.invoke(dapi_ci)  # pylint: disable=no-value-for-parameter
     assert result.exit_code == 0
     assert result.output.startswith("# OpenDAPI CI")
     m_adapter_run.assert_called_once()
+    m_adapter_close.assert_called_once()
+
+
+def test_dapi_ci_closes_session_on_error(mocker, monkeypatch):
+    """Test the main function closes the HTTP session when the run fails"""
+    m_adapter_run = mocker.patch.object(DAPIServerAdapter, "run")
+    m_adapter_run.side_effect = RuntimeError("run failed")
+    m_adapter_close = mocker.spy(DAPIServerAdapter, "close")
+    mock_event(mocker, monkeypatch, "push")
+    _stub_open(mocker, read_data="dummy")
+    runner = CliRunner()
+    result = runner.invoke(dapi_ci)  # pylint: disable=no-value-for-parameter
+    assert isinstance(result.exception, RuntimeError)
+    m_adapter_close.assert_called_once()
 
 
-def test_dapi_ci_unspecified_event_path(mocker):
+def test_dapi_ci_unspecified_event_path(mocker, monkeypatch):
     """Test the main function"""
-    new_environ = os.environ.copy()
-    new_environ.pop("GITHUB_EVENT_PATH", None)
-    mocker.patch.dict(os.environ, new_environ, clear=True)
+    monkeypatch.delenv("GITHUB_EVENT_PATH", raising=False)
     m_adapter_run = mocker.patch.object(DAPIServerAdapter, "run")
-    m_open = mocker.mock_open(read_data="dummy")
-    mocker.patch("builtins.open", m_open)
+    _stub_open(mocker, read_data="dummy")
     runner = CliRunner()
     result = runner.invoke(dapi_ci)  # pylint: disable=no-value-for-parameter
     assert result.exit_code == 1
@@ -1137,9 +942,8 @@ def test_dapi_ci_unspecified_event_path(mocker):
 def test_dapi_ci_invalid_github_event(mocker):
     """Test the main function"""
     m_adapter_run = mocker.patch.object(DAPIServerAdapter, "run")
-    m_open = mocker.mock_open(read_data="dummy")
-    mocker.patch("builtins.open", m_open)
-    m_json = mocker.patch("json.load")
+    _stub_open(mocker, read_data="dummy")
+    m_json = mocker.patch("opendapi.scripts.dapi_ci.json.load")
     m_json.side_effect = json.JSONDecodeError("error", "doc", 0)
     runner = CliRunner()
     result = runner.invoke(dapi_ci)  # pylint: disable=no-value-for-parameter
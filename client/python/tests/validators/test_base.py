@@ -1,11 +1,16 @@
 # pylint: disable=protected-access, no-member, abstract-method, invalid-name
 """Tests for opendapi.validators.base module"""
 
+import copy
+import io
 import os
 import pytest
 
 from pytest_mock import MockFixture
+from jsonschema.protocols import Validator as JsonSchemaValidator
 from requests.exceptions import RequestException
+from ruamel.yaml import YAML
+from ruamel.yaml.comments import CommentedMap
 
 from opendapi.validators.base import (
     BaseValidator,
@@ -22,6 +27,20 @@ class BaseValidatorForTesting(BaseValidator):
     AUTOUPDATE_DISALLOW_NEW_ENTRIES_PATH = [["listuniquedict"]]
 
 
+@pytest.fixture(name="validator_prototype", scope="module")
+def fixture_validator_prototype(tmp_path_factory):
+    """Return a validator over an empty directory, built once per module"""
+    return BaseValidatorForTesting(str(tmp_path_factory.mktemp("validator")))
+
+
+@pytest.fixture(name="validator")
+def fixture_validator(validator_prototype):
+    """Return a default validator for tests that don't touch the filesystem"""
+    validator = copy.copy(validator_prototype)
+    validator.parsed_files = {}
+    return validator
+
+
 # Test BaseValidator class methods
 @pytest.mark.parametrize(
     "enforce_existence, should_autoupdate, expected_error",
@@ -44,81 +63,80 @@ def test_init(temp_directory, enforce_existence, should_autoupdate, expected_err
         )
 
 
-def test_validate_schema(temp_directory, mock_requests_get):
+SAMPLE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "schema": {"type": "string", "format": "uri"},
+        "name": {"type": "string"},
+    },
+    "required": ["name", "schema"],
+}
+
+
+def test_validate_schema(validator, mock_requests_get):
     """Test BaseValidator.validate_schema method"""
-    mock_requests_get.return_value.json.return_value = {
-        "type": "object",
-        "properties": {
-            "schema": {"type": "string", "format": "uri"},
-            "name": {"type": "string"},
-        },
-        "required": ["name", "schema"],
-    }
-    validator = BaseValidatorForTesting(temp_directory)
+    mock_requests_get.return_value.json.return_value = SAMPLE_SCHEMA
     content = {"schema": "https://opendapi.org/schema.json", "name": "hello"}
     validator.validate_schema("dummy.yaml", content)
     mock_requests_get.assert_called_once_with(
         "https://opendapi.org/schema.json", timeout=2
     )
-    # check if the schema is cached
-    assert "https://opendapi.org/schema.json" in validator.schema_cache
-
-
-def test_validate_schema_fails_validation(temp_directory, mock_requests_get):
-    """Test BaseValidator.validate_schema method fails validation"""
-    mock_requests_get.return_value.json.return_value = {
-        "type": "object",
-        "properties": {
-            "schema": {"type": "string", "format": "uri"},
-            "name": {"type": "string"},
-        },
-        "required": ["name", "schema"],
-    }
-    validator = BaseValidatorForTesting(temp_directory)
-    content = {"schema": "https://opendapi.org/schema.json"}
-    with pytest.raises(ValidationError):
-        validator.validate_schema("dummy.yaml", content)
-    mock_requests_get.assert_called_once_with(
-        "https://opendapi.org/schema.json", timeout=2
+    # check if the compiled schema is cached
+    assert isinstance(
+        validator.schema_cache["https://opendapi.org/schema.json"],
+        JsonSchemaValidator,
     )
 
 
-def test_validate_schema_missing_error(temp_directory, mock_requests_get):
-    """Test BaseValidator.validate_schema method fails validation"""
-    mock_requests_get.return_value.json.return_value = {
-        "type": "object",
-        "properties": {
-            "schema": {"type": "string", "format": "uri"},
-            "name": {"type": "string"},
-        },
-        "required": ["name", "schema"],
-    }
-    validator = BaseValidatorForTesting(temp_directory)
-    content = []
-    with pytest.raises(ValidationError):
-        validator.validate_schema("dummy.yaml", content)
-    mock_requests_get.assert_not_called()
-
-
-def test_validate_schema_request_error(temp_directory, mock_requests_get):
-    """Test BaseValidator.validate_schema method fails validation"""
-    mock_requests_get.side_effect = RequestException("Mocked Request Error")
-    validator = BaseValidatorForTesting(temp_directory)
-    content = {"schema": "https://opendapi.org/schema.json"}
-    with pytest.raises(ValidationError):
-        validator.validate_schema("dummy.yaml", content)
-    mock_requests_get.assert_called_once_with(
-        "https://opendapi.org/schema.json", timeout=2
-    )
+@pytest.mark.usefixtures("serve_opendapi_schemas")
+def test_validate_schema_fetches_published_schema(
+    temp_directory, mocker, schema_cache, valid_teams
+):
+    """Test BaseValidator.validate_schema fetches and compiles a schema only once"""
+    schema_cache.clear()
+    compile_schema = mocker.spy(BaseValidator, "compile_schema")
+    # the compiled schema is shared by all validators, not just one instance
+    for _ in range(2):
+        BaseValidatorForTesting(temp_directory).validate_schema(
+            "dummy.yaml", valid_teams
+        )
+    compile_schema.assert_called_once()
+    assert isinstance(schema_cache[valid_teams["schema"]], JsonSchemaValidator)
 
 
-def test_validate_schema_invalid_schema_host(temp_directory, mock_requests_get):
+@pytest.mark.parametrize(
+    "content, schema_side_effect, is_schema_fetched",
+    [
+        # fails validation
+        ({"schema": "https://opendapi.org/schema.json"}, None, True),
+        # missing schema
+        ([], None, False),
+        # request error
+        (
+            {"schema": "https://opendapi.org/schema.json"},
+            RequestException("Mocked Request Error"),
+            True,
+        ),
+        # invalid schema host
+        ({"schema": "https://invalid_url.com/schema.json"}, None, False),
+        # schema that isn't a URL
+        ({"schema": None}, None, False),
+    ],
+)
+def test_validate_schema_errors(
+    validator, mock_requests_get, content, schema_side_effect, is_schema_fetched
+):
     """Test BaseValidator.validate_schema method fails validation"""
-    validator = BaseValidatorForTesting(temp_directory)
-    content = {"schema": "https://invalid_url.com/schema.json"}
+    mock_requests_get.return_value.json.return_value = SAMPLE_SCHEMA
+    mock_requests_get.side_effect = schema_side_effect
     with pytest.raises(ValidationError):
         validator.validate_schema("dummy.yaml", content)
-    mock_requests_get.assert_not_called()
+    if is_schema_fetched:
+        mock_requests_get.assert_called_once_with(
+            "https://opendapi.org/schema.json", timeout=2
+        )
+    else:
+        mock_requests_get.assert_not_called()
 
 
 def test_validate_existance(temp_directory):
@@ -130,9 +148,8 @@ def test_validate_existance(temp_directory):
     assert validator.validate_existance() is None
 
 
-def test_custom_content_validations(temp_directory, mocker: MockFixture):
+def test_custom_content_validations(validator, mocker: MockFixture):
     """Test BaseValidator.custom_content_validations method"""
-    validator = BaseValidatorForTesting(temp_directory)
     # Mock the method to avoid actual execution
     mocker.patch.object(validator, "custom_content_validations")
     validator.validate_content("dummy.yaml", {})
@@ -143,52 +160,101 @@ def test_get_files_for_suffix(mocker: MockFixture, temp_directory):
     """Test BaseValidator._get_files_for_suffix method"""
     validator = BaseValidatorForTesting(temp_directory)
     mocker.patch(
-        "opendapi.validators.base.glob.glob", return_value=["file1.yaml", "file2.yaml"]
+        "opendapi.validators.base.os.walk",
+        return_value=[
+            ("root", ["sub"], ["file1.yaml", "file2.json", ".hidden.yaml"]),
+            ("root/sub", [], ["file3.yaml", "file4.txt"]),
+        ],
     )
-    files = validator._get_files_for_suffix([".yaml"])
-    assert files == ["file1.yaml", "file2.yaml"]
+    files = validator._get_files_for_suffix([".yaml", ".json"])
+    assert files == ["root/file1.yaml", "root/sub/file3.yaml", "root/file2.json"]
+
+
+def test_get_files_for_suffix_skips_hidden_dirs(temp_directory):
+    """Test BaseValidator._get_files_for_suffix doesn't look in hidden directories"""
+    for dir_name in ["visible", ".hidden"]:
+        os.makedirs(os.path.join(temp_directory, dir_name))
+        with open(
+            os.path.join(temp_directory, dir_name, "file.yaml"), "w", encoding="utf-8"
+        ) as file_handle:
+            file_handle.write("name: file")
+    validator = BaseValidatorForTesting(temp_directory)
+    assert validator._get_files_for_suffix([".yaml"]) == [
+        os.path.join(temp_directory, "visible", "file.yaml")
+    ]
+
 
+def _write_file(path: str, contents: str):
+    """Write the given contents to a file"""
+    with open(path, "w", encoding="utf-8") as file_handle:
+        file_handle.write(contents)
 
-def test_get_file_contents_for_suffix(mocker: MockFixture, temp_directory):
+
+def test_get_file_contents_for_suffix(temp_directory):
     """Test BaseValidator._get_file_contents_for_suffix method"""
     validator = BaseValidatorForTesting(temp_directory)
-    for suffix in ["yaml", "json", "yml"]:
-        validator.SUFFIX = [suffix]
-        mock_open = mocker.mock_open(read_data="dummy")
-        mocker.patch("builtins.open", mock_open)
-        mocker.patch(
-            "opendapi.validators.base.glob.glob",
-            return_value=[f"file1.{suffix}", f"file2.{suffix}"],
-        )
-        mock_yaml_load = mocker.patch.object(validator.yaml, "load", return_value={})
-        mock_json_load = mocker.patch(
-            "opendapi.validators.base.json.load", return_value={}
-        )
-        contents = validator._get_file_contents_for_suffix(validator.SUFFIX)
-        assert contents == {f"file1.{suffix}": {}, f"file2.{suffix}": {}}
-        if suffix in {"yaml", "yml"}:
-            mock_yaml_load.assert_has_calls(
-                [mocker.call("dummy"), mocker.call("dummy")]
-            )
-            mock_json_load.assert_not_called()
-        elif suffix == "json":
-            mock_json_load.assert_called()
-            mock_yaml_load.assert_not_called()
+    file_contents = {
+        "yaml": "name: dummy",
+        "yml": "name: dummy",
+        "json": '{"name": "dummy"}',
+    }
+    for suffix, file_content in file_contents.items():
+        files = [f"{temp_directory}/file{idx}.{suffix}" for idx in range(1, 3)]
+        for file in files:
+            _write_file(file, file_content)
+        contents = validator._get_file_contents_for_suffix([f".{suffix}"])
+        assert contents == {file: {"name": "dummy"} for file in files}
+
+
+def test_get_file_contents_for_suffix_round_trips_for_autoupdate(temp_directory):
+    """Test BaseValidator._get_file_contents_for_suffix keeps comments only for autoupdate"""
+    file = f"{temp_directory}/file.yaml"
+    _write_file(file, "name: dummy  # comment")
+    validator = BaseValidatorForTesting(temp_directory)
+    assert not isinstance(validator.parsed_files[file], CommentedMap)
+    validator = BaseValidatorForTesting(
+        temp_directory, enforce_existence=True, should_autoupdate=True
+    )
+    assert isinstance(validator.parsed_files[file], CommentedMap)
+    assert validator.parsed_files[file] == {"name": "dummy"}
 
 
-def test_get_file_contents_for_suffix_unsupported_suffix(
-    mocker: MockFixture, temp_directory
+# Scalars that YAML 1.1 and YAML 1.2 resolve differently
+_AMBIGUOUS_SCALARS_YAML = """\
+booleans: [yes, no, on, off, y, n, true, false]
+numbers: [010, 0o10, 0x1f, 1_000, 1:20, 1e3, .inf]
+nulls: [~, null, ""]
+dates: [2001-12-14, 2001-12-14t21:59:43.10-05:00]
+"""
+
+
+@pytest.mark.parametrize(
+    "fixture_name",
+    ["valid_teams", "valid_datastores", "valid_purposes", "valid_dapi", None],
+)
+def test_get_file_contents_for_suffix_loaders_agree(
+    temp_directory, request, fixture_name
 ):
+    """Test the validation loader parses YAML like the autoupdate loader"""
+    file = f"{temp_directory}/file.yaml"
+    if fixture_name:
+        with open(file, "w", encoding="utf-8") as file_handle:
+            YAML().dump(request.getfixturevalue(fixture_name), file_handle)
+    else:
+        _write_file(file, _AMBIGUOUS_SCALARS_YAML)
+    validated = BaseValidatorForTesting(temp_directory).parsed_files[file]
+    autoupdated = BaseValidatorForTesting(
+        temp_directory, enforce_existence=True, should_autoupdate=True
+    ).parsed_files[file]
+    assert validated == autoupdated
+
+
+def test_get_file_contents_for_suffix_unsupported_suffix(temp_directory):
     """Test BaseValidator._get_file_contents_for_suffix method with unsupported suffix"""
     validator = BaseValidatorForTesting(temp_directory)
-    validator.SUFFIX = ["txt"]
-    mock_open = mocker.mock_open(read_data="dummy")
-    mocker.patch("builtins.open", mock_open)
-    mocker.patch(
-        "opendapi.validators.base.glob.glob", return_value=["file1.txt", "file2.txt"]
-    )
+    _write_file(f"{temp_directory}/file1.txt", "dummy")
     with pytest.raises(ValidationError, match="Unsupported file type"):
-        validator._get_file_contents_for_suffix(validator.SUFFIX)
+        validator._get_file_contents_for_suffix([".txt"])
 
 
 def test_get_merger(temp_directory):
@@ -196,6 +262,8 @@ def test_get_merger(temp_directory):
     validator = BaseValidatorForTesting(temp_directory)
     merger = validator._get_merger()
     assert merger
+    # built once per class and shared by its instances
+    assert BaseValidatorForTesting(temp_directory)._get_merger() is merger
     base = {
         "str": "hello",
         "list": ["my"],
@@ -230,6 +298,73 @@ def test_get_merger(temp_directory):
     }
 
 
+def test_get_merger_matches_dict_list_items_by_lookup_keys(temp_directory):
+    """Test the merger matches list items on their first set lookup key"""
+
+    class UrnNameValidator(BaseValidatorForTesting):
+        """Validator matching on urn, then name"""
+
+        AUTOUPDATE_UNIQUE_LOOKUP_KEYS = ["urn", "name"]
+
+    merger = UrnNameValidator(temp_directory)._get_merger()
+    base = {
+        "items": [
+            {"urn": "a", "name": "x"},
+            {"name": "b"},
+            {"key": "no lookup value"},
+        ]
+    }
+    override = {
+        "items": [
+            {"name": "a", "key": "first match"},
+            {"urn": "a", "key": "second match"},
+            {"urn": "b", "key": "b"},
+            {"urn": "c"},
+        ]
+    }
+    # each base item is merged with the first item sharing its lookup value
+    assert merger.merge(base, override)["items"][:3] == [
+        {"urn": "a", "name": "a", "key": "first match"},
+        {"name": "b", "urn": "b", "key": "b"},
+        {"key": "no lookup value"},
+    ]
+
+
+def test_get_merger_matches_dict_list_items_by_unhashable_lookup_values(
+    temp_directory,
+):
+    """Test the merger matches list items whose lookup values are dicts or lists"""
+
+    class UrnValidator(BaseValidatorForTesting):
+        """Validator matching on urn"""
+
+        AUTOUPDATE_UNIQUE_LOOKUP_KEYS = ["urn"]
+
+    merger = UrnValidator(temp_directory)._get_merger()
+    base = {
+        "items": [
+            {"urn": {"org": "a"}, "key": "dict"},
+            {"urn": ["b"], "key": "list"},
+            {"urn": ["c"], "key": "unmatched"},
+        ]
+    }
+    override = {
+        "items": [
+            {"urn": ["b"], "key": "list_new"},
+            {"urn": {"org": "a"}, "key": "dict_new"},
+        ]
+    }
+    assert merger.merge(base, override)["items"] == [
+        {"urn": {"org": "a"}, "key": "dict_new"},
+        {"urn": ["b"], "key": "list_new"},
+        {"urn": ["c"], "key": "unmatched"},
+    ]
+    # an empty override keeps the base items as they are
+    assert merger.merge({"items": [{"urn": "a"}]}, {"items": []}) == {
+        "items": [{"urn": "a"}]
+    }
+
+
 def test_validate(temp_directory, mocker):
     """Test BaseValidator.validate method"""
     for enforce_existence in [True, False]:  # Test both cases
@@ -290,10 +425,10 @@ def test_validate_collects_errors(temp_directory, mocker):
     validator.validate_content.assert_called_once()
 
 
-def test_autoupdate(temp_directory, mocker):
+def test_autoupdate(temp_directory, mocker, monkeypatch):
     """Test BaseValidator.autoupdate method"""
     # To override in CI environments
-    mocker.patch.dict(os.environ, {"CI": "false"})
+    monkeypatch.setenv("CI", "false")
     validator = BaseValidatorForTesting(
         temp_directory, enforce_existence=True, should_autoupdate=True
     )
@@ -331,37 +466,28 @@ def test_autoupdate(temp_directory, mocker):
             },
         },
     )
-    mocker.patch("builtins.open", mocker.mock_open())
-    mock_yaml_dump = mocker.patch.object(validator.yaml, "dump")
     validator.autoupdate()
-    mock_yaml_dump.assert_has_calls(
-        [
-            mocker.call(
-                {
-                    "name": "dummy_new",
-                    "list": ["1", "2"],
-                    "listdict": [{"1": "one"}, {"2": "two"}],
-                    "listuniquedict": [{"name": "one"}],
-                },
-                mocker.ANY,
-            ),
-            mocker.call(
-                {
-                    "name": "dummy2_new",
-                    "list": ["2", "3"],
-                    "listdict": [{"2": "two"}, {"3": "three"}],
-                    "listuniquedict": [{"name": "two"}],
-                },
-                mocker.ANY,
-            ),
-        ]
-    )
+    # The updated files are written to disk and read back
+    assert validator.parsed_files == {
+        f"{temp_directory}/dummy.yaml": {
+            "name": "dummy_new",
+            "list": ["1", "2"],
+            "listdict": [{"1": "one"}, {"2": "two"}],
+            "listuniquedict": [{"name": "one"}],
+        },
+        f"{temp_directory}/dummy2.yaml": {
+            "name": "dummy2_new",
+            "list": ["2", "3"],
+            "listdict": [{"2": "two"}, {"3": "three"}],
+            "listuniquedict": [{"name": "two"}],
+        },
+    }
 
 
-def test_autoupdate_doesnt_write_if_no_changes(temp_directory, mocker):
+def test_autoupdate_doesnt_write_if_no_changes(temp_directory, mocker, monkeypatch):
     """Test BaseValidator.autoupdate method with no changes"""
     for is_autoupdate_allowed in [True, False]:
-        mocker.patch.dict(os.environ, {"CI": str(is_autoupdate_allowed)})
+        monkeypatch.setenv("CI", str(is_autoupdate_allowed))
         validator = BaseValidatorForTesting(
             temp_directory, enforce_existence=True, should_autoupdate=True
         )
@@ -389,17 +515,26 @@ def test_autoupdate_doesnt_write_if_no_changes(temp_directory, mocker):
                 },
             },
         )
-        mock_open = mocker.mock_open()
-        mocker.patch("builtins.open", mock_open)
+        mock_open = mocker.patch(
+            "opendapi.validators.base.open",
+            side_effect=lambda *_, **unused: io.StringIO(),
+            create=True,
+        )
         mock_yaml_dump = mocker.patch.object(validator.yaml, "dump")
+        mock_get_contents = mocker.patch.object(
+            validator, "_get_file_contents_for_suffix"
+        )
         validator.autoupdate()
         mock_open.assert_not_called()
         mock_yaml_dump.assert_not_called()
+        mock_get_contents.assert_not_called()
 
 
-def test_autoupdate_raises_error_if_not_allowed_in_CI(temp_directory, mocker):
+def test_autoupdate_raises_error_if_not_allowed_in_CI(
+    temp_directory, mocker, monkeypatch
+):
     """Test BaseValidator.autoupdate raises error when not allowed in CI"""
-    mocker.patch.dict(os.environ, {"CI": "True"})
+    monkeypatch.setenv("CI", "True")
     validator = BaseValidatorForTesting(
         temp_directory, enforce_existence=True, should_autoupdate=True
     )
@@ -423,8 +558,11 @@ def test_autoupdate_raises_error_if_not_allowed_in_CI(temp_directory, mocker):
             },
         },
     )
-    mock_open = mocker.mock_open()
-    mocker.patch("builtins.open", mock_open)
+    mock_open = mocker.patch(
+        "opendapi.validators.base.open",
+        side_effect=lambda *_, **unused: io.StringIO(),
+        create=True,
+    )
     mock_yaml_dump = mocker.patch.object(validator.yaml, "dump")
     with pytest.raises(ValidationError, match="cannot be autoupdated during CI"):
         validator.autoupdate()
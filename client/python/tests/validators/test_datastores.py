@@ -1,13 +1,15 @@
 """Tests for the datastores validator."""
 
+from opendapi.validators.base import BaseValidator
 from opendapi.validators.datastores import DatastoresValidator
 
 
-def test_collect_datastores_urn(temp_directory, mocker, valid_datastores):
+def test_collect_datastores_urn(temp_directory, monkeypatch, valid_datastores):
     """Test if the datastore urns are collected correctly"""
-    mocker.patch(
-        "opendapi.validators.base.BaseValidator._get_file_contents_for_suffix",
-        return_value={
+    monkeypatch.setattr(
+        BaseValidator,
+        "_get_file_contents_for_suffix",
+        lambda self, suffixes: {
             f"{temp_directory}/my_company.datastores.yaml": valid_datastores,
         },
     )
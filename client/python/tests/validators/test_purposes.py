@@ -1,13 +1,15 @@
 """Tests for the purposes validator."""
 
+from opendapi.validators.base import BaseValidator
 from opendapi.validators.purposes import PurposesValidator
 
 
-def test_collect_purposes_urn(temp_directory, mocker, valid_purposes):
+def test_collect_purposes_urn(temp_directory, monkeypatch, valid_purposes):
     """Test if the purpose urns are collected correctly"""
-    mocker.patch(
-        "opendapi.validators.base.BaseValidator._get_file_contents_for_suffix",
-        return_value={
+    monkeypatch.setattr(
+        BaseValidator,
+        "_get_file_contents_for_suffix",
+        lambda self, suffixes: {
             f"{temp_directory}/my_company.purposes.yaml": valid_purposes,
         },
     )
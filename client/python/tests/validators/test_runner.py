@@ -1,6 +1,7 @@
 # pylint: disable=protected-access,too-many-instance-attributes,invalid-name,unnecessary-lambda-assignment
 """Tests for Validation Runners"""
 import os
+from types import SimpleNamespace
 from typing import Dict, List, Optional
 
 import pytest
@@ -19,16 +20,15 @@ from opendapi.validators.runner import (
     MultiValidationError,
 )
 
+_REPO_ROOT = get_root_dir_fullpath(__file__, "OpenDAPI")
+
 
 class TestRunner(Runner):
     """Test Runner class"""
 
     # File structure
-    REPO_ROOT_DIR_PATH: str = get_root_dir_fullpath(__file__, "OpenDAPI")
-    DAPIS_DIR_PATH: str = os.path.join(
-        get_root_dir_fullpath(__file__, "OpenDAPI"),
-        "dapis",
-    )
+    REPO_ROOT_DIR_PATH: str = _REPO_ROOT
+    DAPIS_DIR_PATH: str = os.path.join(_REPO_ROOT, "dapis")
     DAPIS_VERSION: str = "0-0-1"
 
     # Configuration
@@ -64,67 +64,177 @@ class TestRunner(Runner):
     ADDITIONAL_DAPI_VALIDATORS = []
 
 
-def test_root_and_dapis_dir():
+EXPECTED_TEAMS_DEFAULT = {
+    "schema": "https://opendapi.org/spec/0-0-1/teams.json",
+    "organization": {"name": "acme_co", "slack_teams": []},
+    "teams": [],
+}
+EXPECTED_TEAMS_CONFIGURED = {
+    "schema": "https://opendapi.org/spec/0-0-1/teams.json",
+    "organization": {"name": "acme_co", "slack_teams": ["T12345678"]},
+    "teams": [
+        {
+            "urn": f"acme_co.teams.{name}",
+            "name": name,
+            "domain": PLACEHOLDER_TEXT,
+            "email": f"grp.{name}@company.com",
+        }
+        for name in ("team1", "team2")
+    ],
+}
+EXPECTED_DATASTORES_DEFAULT = {
+    "schema": "https://opendapi.org/spec/0-0-1/datastores.json",
+    "datastores": [],
+}
+EXPECTED_DATASTORES_CONFIGURED = {
+    "schema": "https://opendapi.org/spec/0-0-1/datastores.json",
+    "datastores": [
+        {
+            "urn": f"acme_co.datastores.{name}",
+            "type": type_,
+            "host": {"env_prod": {"location": PLACEHOLDER_TEXT}},
+        }
+        for name, type_ in (("ds1", "snowflake"), ("ds2", "dynamodb"))
+    ],
+}
+EXPECTED_PURPOSES_DEFAULT = {
+    "schema": "https://opendapi.org/spec/0-0-1/purposes.json",
+    "purposes": [],
+}
+EXPECTED_PURPOSES_CONFIGURED = {
+    "schema": "https://opendapi.org/spec/0-0-1/purposes.json",
+    "purposes": [
+        {"urn": f"acme_co.purposes.{name}", "description": PLACEHOLDER_TEXT}
+        for name in ("purpose1", "purpose2")
+    ],
+}
+
+
+def _expected_dapi(producer: dict, consumer: dict) -> dict:
+    """Return the DAPI template the runner builds for my_table"""
+    return {
+        "schema": "https://opendapi.org/spec/0-0-1/dapi.json",
+        "urn": "acme_co.dapis.my_table",
+        "type": "entity",
+        "description": PLACEHOLDER_TEXT,
+        "owner_team_urn": PLACEHOLDER_TEXT,
+        "datastores": {"producers": [producer], "consumers": [consumer]},
+        "fields": [],
+        "primary_key": [],
+    }
+
+
+_PLACEHOLDER_CONSUMER = {
+    "urn": PLACEHOLDER_TEXT,
+    "data": {"identifier": PLACEHOLDER_TEXT, "namespace": PLACEHOLDER_TEXT},
+}
+_CONFIGURED_CONSUMER = {
+    "urn": "acme_co.datastores.ds2",
+    "data": {"identifier": "SNOWFLAKE_MY_TABLE", "namespace": "SCHEMA"},
+}
+EXPECTED_PYNAMODB_DAPI_DEFAULT = _expected_dapi(
+    {
+        "urn": PLACEHOLDER_TEXT,
+        "data": {"identifier": "my_table", "namespace": ""},
+    },
+    _PLACEHOLDER_CONSUMER,
+)
+EXPECTED_PYNAMODB_DAPI_CONFIGURED = _expected_dapi(
+    {
+        "urn": "acme_co.datastores.ds1",
+        "data": {"identifier": "my_table", "namespace": ""},
+    },
+    _CONFIGURED_CONSUMER,
+)
+EXPECTED_SQLALCHEMY_DAPI_DEFAULT = _expected_dapi(
+    {
+        "urn": PLACEHOLDER_TEXT,
+        "data": {"identifier": "my_table", "namespace": "my_schema"},
+    },
+    _PLACEHOLDER_CONSUMER,
+)
+EXPECTED_SQLALCHEMY_DAPI_CONFIGURED = _expected_dapi(
+    {
+        "urn": "acme_co.datastores.ds1",
+        "data": {"identifier": "my_table", "namespace": "my_schema"},
+    },
+    _CONFIGURED_CONSUMER,
+)
+
+
+@pytest.fixture(name="runner")
+def fixture_runner():
+    """Return a new runner so config overrides stay per-test"""
+    return TestRunner()
+
+
+@pytest.fixture(name="mock_validators")
+def fixture_mock_validators(runner, mocker):
+    """Replace the runner's validator factories with mocks"""
+    for factory in (
+        "_teams_validator",
+        "_datastores_validator",
+        "_purposes_validator",
+        "_pynamodb_dapi_validator",
+        "_sqlalchemy_dapi_validator",
+    ):
+        setattr(runner, factory, mocker.MagicMock())
+    return runner
+
+
+def _pynamodb_table(table_name: str) -> SimpleNamespace:
+    """Return a stand-in for a pynamodb model without attributes"""
+    return SimpleNamespace(
+        Meta=SimpleNamespace(table_name=table_name), get_attributes=dict
+    )
+
+
+def _sqlalchemy_metadata(*tables: SimpleNamespace) -> SimpleNamespace:
+    """Return a stand-in for a sqlalchemy MetaData object"""
+    return SimpleNamespace(sorted_tables=list(tables))
+
+
+def _sqlalchemy_table(name: str, schema: str) -> SimpleNamespace:
+    """Return a stand-in for a sqlalchemy table without columns"""
+    return SimpleNamespace(name=name, schema=schema, columns=[])
+
+
+def test_root_and_dapis_dir(runner):
     """Test root and dapis dir"""
-    runner = TestRunner()
     assert runner.root_dir == runner.REPO_ROOT_DIR_PATH
     assert runner.dapis_dir == runner.DAPIS_DIR_PATH
 
 
-def test_enforce_dapis_dir_subdir_of_root_dir():
+def test_enforce_dapis_dir_subdir_of_root_dir(runner):
     """Test enforce dapis dir subdir of root dir"""
-    runner = TestRunner()
     runner.DAPIS_DIR_PATH = "/not_subdir_of_root_dir"
     with pytest.raises(RunnerException):
         assert runner.dapis_dir is not None
 
 
-def test_teams_validator_default():
+def test_teams_validator_default(runner):
     """Test default teams validator"""
-    runner = TestRunner()
     validator = runner._teams_validator(runner)
     assert issubclass(validator, TeamsValidator)
     template = validator(runner.root_dir).base_template_for_autoupdate()
     expected_location = f"{runner.DAPIS_DIR_PATH}/acme_co.teams.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/teams.json",
-        "organization": {"name": "acme_co", "slack_teams": []},
-        "teams": [],
-    }
+    assert content == EXPECTED_TEAMS_DEFAULT
 
 
-def test_teams_validator_default_configured():
+def test_teams_validator_default_configured(runner):
     """Test default teams validator with additional configuration"""
-    runner = TestRunner()
     runner.SEED_TEAMS_NAMES = ["team1", "team2"]
     runner.ORG_SLACK_TEAM_ID = "T12345678"
     validator = runner._teams_validator(runner)
     template = validator(runner.root_dir).base_template_for_autoupdate()
     expected_location = f"{runner.DAPIS_DIR_PATH}/acme_co.teams.yaml"
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/teams.json",
-        "organization": {"name": "acme_co", "slack_teams": ["T12345678"]},
-        "teams": [
-            {
-                "urn": "acme_co.teams.team1",
-                "name": "team1",
-                "domain": PLACEHOLDER_TEXT,
-                "email": "grp.team1@company.com",
-            },
-            {
-                "urn": "acme_co.teams.team2",
-                "name": "team2",
-                "domain": PLACEHOLDER_TEXT,
-                "email": "grp.team2@company.com",
-            },
-        ],
-    }
+    assert content == EXPECTED_TEAMS_CONFIGURED
 
 
-def test_teams_validator_override():
+def test_teams_validator_override(runner):
     """Test teams validator override with custom validator"""
 
     class CustomTeamsValidator(TeamsValidator):
@@ -133,7 +243,6 @@ def test_teams_validator_override():
         def base_template_for_autoupdate(self) -> Dict[str, Dict]:
             return {"custom": "template"}
 
-    runner = TestRunner()
     runner.OVERRIDE_TEAMS_VALIDATOR = CustomTeamsValidator
     validator = runner._teams_validator(runner)
     assert validator == CustomTeamsValidator
@@ -141,55 +250,28 @@ def test_teams_validator_override():
     assert template == {"custom": "template"}
 
 
-def test_datastores_validator_default():
+def test_datastores_validator_default(runner):
     """Test default datastores validator"""
-    runner = TestRunner()
     validator = runner._datastores_validator(runner)
     assert issubclass(validator, DatastoresValidator)
     template = validator(runner.root_dir).base_template_for_autoupdate()
     expected_location = f"{runner.DAPIS_DIR_PATH}/acme_co.datastores.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/datastores.json",
-        "datastores": [],
-    }
+    assert content == EXPECTED_DATASTORES_DEFAULT
 
 
-def test_datastores_validator_default_configured():
+def test_datastores_validator_default_configured(runner):
     """Test default datastores validator with additional configuration"""
-    runner = TestRunner()
     runner.SEED_DATASTORES_NAMES_WITH_TYPES = {"ds1": "snowflake", "ds2": "dynamodb"}
     validator = runner._datastores_validator(runner)
     template = validator(runner.root_dir).base_template_for_autoupdate()
     expected_location = f"{runner.DAPIS_DIR_PATH}/acme_co.datastores.yaml"
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/datastores.json",
-        "datastores": [
-            {
-                "urn": "acme_co.datastores.ds1",
-                "type": "snowflake",
-                "host": {
-                    "env_prod": {
-                        "location": PLACEHOLDER_TEXT,
-                    }
-                },
-            },
-            {
-                "urn": "acme_co.datastores.ds2",
-                "type": "dynamodb",
-                "host": {
-                    "env_prod": {
-                        "location": PLACEHOLDER_TEXT,
-                    }
-                },
-            },
-        ],
-    }
+    assert content == EXPECTED_DATASTORES_CONFIGURED
 
 
-def test_datastores_validator_override():
+def test_datastores_validator_override(runner):
     """Test datastores validator override with custom validator"""
 
     class CustomDatastoresValidator(DatastoresValidator):
@@ -198,7 +280,6 @@ def test_datastores_validator_override():
         def base_template_for_autoupdate(self) -> Dict[str, Dict]:
             return {"custom": "template"}
 
-    runner = TestRunner()
     runner.OVERRIDE_DATASTORES_VALIDATOR = CustomDatastoresValidator
     validator = runner._datastores_validator(runner)
     assert validator == CustomDatastoresValidator
@@ -206,45 +287,28 @@ def test_datastores_validator_override():
     assert template == {"custom": "template"}
 
 
-def test_purposes_validator_default():
+def test_purposes_validator_default(runner):
     """Test default purposes validator"""
-    runner = TestRunner()
     validator = runner._purposes_validator(runner)
     assert issubclass(validator, PurposesValidator)
     template = validator(runner.root_dir).base_template_for_autoupdate()
     expected_location = f"{runner.DAPIS_DIR_PATH}/acme_co.purposes.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/purposes.json",
-        "purposes": [],
-    }
+    assert content == EXPECTED_PURPOSES_DEFAULT
 
 
-def test_purposes_validator_default_configured():
+def test_purposes_validator_default_configured(runner):
     """Test default purposes validator with additional configurations"""
-    runner = TestRunner()
     runner.SEED_PURPOSES_NAMES = ["purpose1", "purpose2"]
     validator = runner._purposes_validator(runner)
     template = validator(runner.root_dir).base_template_for_autoupdate()
     expected_location = f"{runner.DAPIS_DIR_PATH}/acme_co.purposes.yaml"
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/purposes.json",
-        "purposes": [
-            {
-                "urn": "acme_co.purposes.purpose1",
-                "description": PLACEHOLDER_TEXT,
-            },
-            {
-                "urn": "acme_co.purposes.purpose2",
-                "description": PLACEHOLDER_TEXT,
-            },
-        ],
-    }
+    assert content == EXPECTED_PURPOSES_CONFIGURED
 
 
-def test_purposes_validator_override():
+def test_purposes_validator_override(runner):
     """Test purposes validator override with custom validator"""
 
     class CustomPurposesValidator(PurposesValidator):
@@ -253,7 +317,6 @@ def test_purposes_validator_override():
         def base_template_for_autoupdate(self) -> Dict[str, dict]:
             return {"custom": "template"}
 
-    runner = TestRunner()
     runner.OVERRIDE_PURPOSES_VALIDATOR = CustomPurposesValidator
     validator = runner._purposes_validator(runner)
     assert validator == CustomPurposesValidator
@@ -261,12 +324,10 @@ def test_purposes_validator_override():
     assert template == {"custom": "template"}
 
 
-def test_pynamodb_dapi_validator_with_base_class(mocker):
+def test_pynamodb_dapi_validator_with_base_class(runner, mocker):
     """Test pynamodb dapi validator with base class"""
-    runner = TestRunner()
     runner.PYNAMODB_TABLES_BASE_CLS = mocker.MagicMock()
-    m_pynamodb_table = mocker.MagicMock()
-    m_pynamodb_table.Meta.table_name = "my_table"
+    m_pynamodb_table = _pynamodb_table("my_table")
     mocker.patch(
         "opendapi.validators.runner.find_subclasses_in_directory",
         return_value=[m_pynamodb_table],
@@ -277,32 +338,7 @@ def test_pynamodb_dapi_validator_with_base_class(mocker):
     expected_location = f"{runner.DAPIS_DIR_PATH}/pynamodb/my_table.dapi.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/dapi.json",
-        "urn": "acme_co.dapis.my_table",
-        "type": "entity",
-        "description": PLACEHOLDER_TEXT,
-        "owner_team_urn": PLACEHOLDER_TEXT,
-        "datastores": {
-            "producers": [
-                {
-                    "urn": PLACEHOLDER_TEXT,
-                    "data": {"identifier": "my_table", "namespace": ""},
-                }
-            ],
-            "consumers": [
-                {
-                    "urn": PLACEHOLDER_TEXT,
-                    "data": {
-                        "identifier": PLACEHOLDER_TEXT,
-                        "namespace": PLACEHOLDER_TEXT,
-                    },
-                }
-            ],
-        },
-        "fields": [],
-        "primary_key": [],
-    }
+    assert content == EXPECTED_PYNAMODB_DAPI_DEFAULT
 
 
 def test_pynamodb_dapi_validator_with_base_class_enriched(mocker):
@@ -320,8 +356,7 @@ def test_pynamodb_dapi_validator_with_base_class_enriched(mocker):
         )
 
     runner = UpdatedTestRunner()
-    m_pynamodb_table = mocker.MagicMock()
-    m_pynamodb_table.Meta.table_name = "my_table"
+    m_pynamodb_table = _pynamodb_table("my_table")
     mocker.patch(
         "opendapi.validators.runner.find_subclasses_in_directory",
         return_value=[m_pynamodb_table],
@@ -332,49 +367,20 @@ def test_pynamodb_dapi_validator_with_base_class_enriched(mocker):
     expected_location = f"{runner.DAPIS_DIR_PATH}/pynamodb/my_table.dapi.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/dapi.json",
-        "urn": "acme_co.dapis.my_table",
-        "type": "entity",
-        "description": PLACEHOLDER_TEXT,
-        "owner_team_urn": PLACEHOLDER_TEXT,
-        "datastores": {
-            "producers": [
-                {
-                    "urn": "acme_co.datastores.ds1",
-                    "data": {"identifier": "my_table", "namespace": ""},
-                }
-            ],
-            "consumers": [
-                {
-                    "urn": "acme_co.datastores.ds2",
-                    "data": {
-                        "identifier": "SNOWFLAKE_MY_TABLE",
-                        "namespace": "SCHEMA",
-                    },
-                }
-            ],
-        },
-        "fields": [],
-        "primary_key": [],
-    }
+    assert content == EXPECTED_PYNAMODB_DAPI_CONFIGURED
 
 
-def test_pynamodb_dapi_validator_with_override_tables(mocker):
+def test_pynamodb_dapi_validator_with_override_tables(runner, mocker):
     """Test pynamodb dapi validator overridden with"""
-    runner = TestRunner()
     runner.PYNAMODB_TABLES_BASE_CLS = mocker.MagicMock()
-    m_pynamodb_table = mocker.MagicMock()
-    m_pynamodb_table.Meta.table_name = "my_table"
+    m_pynamodb_table = _pynamodb_table("my_table")
     mocker.patch(
         "opendapi.validators.runner.find_subclasses_in_directory",
         return_value=[m_pynamodb_table],
     )
 
     # Pass a list of models instead of a base class
-    override_table = mocker.MagicMock()
-    override_table.Meta.table_name = "override_table"
-    runner.PYNAMODB_TABLES = [override_table]
+    runner.PYNAMODB_TABLES = [_pynamodb_table("override_table")]
 
     validator = runner._pynamodb_dapi_validator(runner)
     assert issubclass(validator, PynamodbDapiValidator)
@@ -383,15 +389,11 @@ def test_pynamodb_dapi_validator_with_override_tables(mocker):
     assert template.keys() == {expected_location}
 
 
-def test_sqlalchemy_dapi_validator_with_metadata_objects(mocker):
+def test_sqlalchemy_dapi_validator_with_metadata_objects(runner):
     """Test sqlalchemy dapi validator with metadata objects"""
-    runner = TestRunner()
-    m_sqlalchemy_metadata_objs = mocker.MagicMock()
-    runner.SQLALCHEMY_TABLES_METADATA_OBJECTS = [m_sqlalchemy_metadata_objs]
-    m_sqlalchemy_table = mocker.MagicMock()
-    m_sqlalchemy_metadata_objs.sorted_tables = [m_sqlalchemy_table]
-    m_sqlalchemy_table.name = "my_table"
-    m_sqlalchemy_table.schema = "my_schema"
+    runner.SQLALCHEMY_TABLES_METADATA_OBJECTS = [
+        _sqlalchemy_metadata(_sqlalchemy_table("my_table", "my_schema"))
+    ]
 
     validator = runner._sqlalchemy_dapi_validator(runner)
     assert issubclass(validator, SqlAlchemyDapiValidator)
@@ -400,41 +402,14 @@ def test_sqlalchemy_dapi_validator_with_metadata_objects(mocker):
     expected_location = f"{runner.DAPIS_DIR_PATH}/sqlalchemy/my_table.dapi.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/dapi.json",
-        "urn": "acme_co.dapis.my_table",
-        "type": "entity",
-        "description": PLACEHOLDER_TEXT,
-        "owner_team_urn": PLACEHOLDER_TEXT,
-        "datastores": {
-            "producers": [
-                {
-                    "urn": PLACEHOLDER_TEXT,
-                    "data": {"identifier": "my_table", "namespace": "my_schema"},
-                }
-            ],
-            "consumers": [
-                {
-                    "urn": PLACEHOLDER_TEXT,
-                    "data": {
-                        "identifier": PLACEHOLDER_TEXT,
-                        "namespace": PLACEHOLDER_TEXT,
-                    },
-                }
-            ],
-        },
-        "fields": [],
-        "primary_key": [],
-    }
+    assert content == EXPECTED_SQLALCHEMY_DAPI_DEFAULT
 
 
-def test_sqlalchemy_dapi_validator_with_metadata_objects_enriched(mocker):
+def test_sqlalchemy_dapi_validator_with_metadata_objects_enriched():
     """Test sqlalchemy dapi validator with metadata objects"""
-    m_sqlalchemy_metadata_objs = mocker.MagicMock()
-    m_sqlalchemy_table = mocker.MagicMock()
-    m_sqlalchemy_metadata_objs.sorted_tables = [m_sqlalchemy_table]
-    m_sqlalchemy_table.name = "my_table"
-    m_sqlalchemy_table.schema = "my_schema"
+    m_sqlalchemy_metadata_objs = _sqlalchemy_metadata(
+        _sqlalchemy_table("my_table", "my_schema")
+    )
 
     class UpdatedTestRunner(TestRunner):
         """Test runner with overridden config"""
@@ -454,49 +429,17 @@ def test_sqlalchemy_dapi_validator_with_metadata_objects_enriched(mocker):
     expected_location = f"{runner.DAPIS_DIR_PATH}/sqlalchemy/my_table.dapi.yaml"
     assert template.keys() == {expected_location}
     content = template[expected_location]
-    assert content == {
-        "schema": "https://opendapi.org/spec/0-0-1/dapi.json",
-        "urn": "acme_co.dapis.my_table",
-        "type": "entity",
-        "description": PLACEHOLDER_TEXT,
-        "owner_team_urn": PLACEHOLDER_TEXT,
-        "datastores": {
-            "producers": [
-                {
-                    "urn": "acme_co.datastores.ds1",
-                    "data": {"identifier": "my_table", "namespace": "my_schema"},
-                }
-            ],
-            "consumers": [
-                {
-                    "urn": "acme_co.datastores.ds2",
-                    "data": {
-                        "identifier": "SNOWFLAKE_MY_TABLE",
-                        "namespace": "SCHEMA",
-                    },
-                }
-            ],
-        },
-        "fields": [],
-        "primary_key": [],
-    }
+    assert content == EXPECTED_SQLALCHEMY_DAPI_CONFIGURED
 
 
-def test_sqlalchemy_dapi_validator_with_override_tables(mocker):
+def test_sqlalchemy_dapi_validator_with_override_tables(runner):
     """Test sqlalchemy dapi validator with override tables"""
-    runner = TestRunner()
-    m_sqlalchemy_metadata_objs = mocker.MagicMock()
-    runner.SQLALCHEMY_TABLES_METADATA_OBJECTS = [m_sqlalchemy_metadata_objs]
-    m_sqlalchemy_table = mocker.MagicMock()
-    m_sqlalchemy_metadata_objs.sorted_tables = [m_sqlalchemy_table]
-    m_sqlalchemy_table.name = "my_table"
-    m_sqlalchemy_table.schema = "my_schema"
+    runner.SQLALCHEMY_TABLES_METADATA_OBJECTS = [
+        _sqlalchemy_metadata(_sqlalchemy_table("my_table", "my_schema"))
+    ]
 
     # Pass a list of models instead of a base class
-    override_table = mocker.MagicMock()
-    override_table.name = "override_table"
-    override_table.schema = "override_schema"
-    runner.SQLALCHEMY_TABLES = [override_table]
+    runner.SQLALCHEMY_TABLES = [_sqlalchemy_table("override_table", "override_schema")]
 
     validator = runner._sqlalchemy_dapi_validator(runner)
     assert issubclass(validator, SqlAlchemyDapiValidator)
@@ -505,49 +448,37 @@ def test_sqlalchemy_dapi_validator_with_override_tables(mocker):
     assert template.keys() == {expected_location}
 
 
-def test_run_with_no_errors(mocker):
+@pytest.mark.usefixtures("mock_validators")
+@pytest.mark.parametrize("fully_configured", [False, True])
+def test_run_with_no_errors(runner, mocker, fully_configured):
     """Test run with no errors"""
-    runner = TestRunner()
-    runner._teams_validator = mocker.MagicMock()
-    runner._datastores_validator = mocker.MagicMock()
-    runner._purposes_validator = mocker.MagicMock()
-    runner._pynamodb_dapi_validator = mocker.MagicMock()
-    runner._sqlalchemy_dapi_validator = mocker.MagicMock()
+    additional_validator = mocker.MagicMock()
+    if fully_configured:
+        # Configure to run Purposes, PynamoDB, SQLAlchemy and additional validators
+        runner.PURPOSES_VALIDATION_ENABLED = True
+        runner.PYNAMODB_TABLES = [_pynamodb_table("my_table")]
+        runner.SQLALCHEMY_TABLES = [_sqlalchemy_table("my_table", "my_schema")]
+        runner.ADDITIONAL_DAPI_VALIDATORS = [additional_validator]
 
     runner.run()
 
-    runner._teams_validator.return_value.return_value.run.assert_called_once()
-    runner._datastores_validator.return_value.return_value.run.assert_called_once()
-
-    # Purposes not called until PURPOSES_VALIDATION_ENABLED is True
-    runner._purposes_validator.return_value.return_value.run.assert_not_called()
-
-    # PynamoDB and SQLAlchemy validators are not called until their respective classes are set
-    runner._pynamodb_dapi_validator.return_value.return_value.run.assert_not_called()
-    runner._sqlalchemy_dapi_validator.return_value.return_value.run.assert_not_called()
-
-    # Configure to run Purposes, PynamoDB and SQLAlchemy validators
-    runner.PURPOSES_VALIDATION_ENABLED = True
-    runner.PYNAMODB_TABLES = [mocker.MagicMock()]
-    runner.SQLALCHEMY_TABLES = [mocker.MagicMock()]
-    additional_validator = mocker.MagicMock()
-    runner.ADDITIONAL_DAPI_VALIDATORS = [additional_validator]
-    runner.run()
+    assert runner._teams_validator.return_value.return_value.run.call_count == 1
+    assert runner._datastores_validator.return_value.return_value.run.call_count == 1
 
-    runner._purposes_validator.return_value.return_value.run.assert_called_once()
-    runner._pynamodb_dapi_validator.return_value.return_value.run.assert_called_once()
-    runner._sqlalchemy_dapi_validator.return_value.return_value.run.assert_called_once()
-    additional_validator.return_value.run.assert_called_once()
+    # The rest only run once purposes are enabled and tables or validators are set
+    expected_count = int(fully_configured)
+    for factory in (
+        runner._purposes_validator,
+        runner._pynamodb_dapi_validator,
+        runner._sqlalchemy_dapi_validator,
+    ):
+        assert factory.return_value.return_value.run.call_count == expected_count
+    assert additional_validator.return_value.run.call_count == expected_count
 
 
-def test_run_with_errors(mocker):
+@pytest.mark.usefixtures("mock_validators")
+def test_run_with_errors(runner):
     """Test run with errors"""
-    runner = TestRunner()
-    runner._teams_validator = mocker.MagicMock()
-    runner._datastores_validator = mocker.MagicMock()
-    runner._purposes_validator = mocker.MagicMock()
-    runner._pynamodb_dapi_validator = mocker.MagicMock()
-    runner._sqlalchemy_dapi_validator = mocker.MagicMock()
 
     # Simulate an error by raising an exception in one of the validators
     runner._teams_validator.return_value.return_value.run.side_effect = (
@@ -1,16 +1,19 @@
 """Tests for the teams validator."""
 
+import copy
+
 import pytest
 
 from opendapi.validators.teams import TeamsValidator
-from opendapi.validators.base import MultiValidationError
+from opendapi.validators.base import BaseValidator, MultiValidationError
 
 
-def test_collect_teams_urn(temp_directory, mocker, valid_teams):
+def test_collect_teams_urn(temp_directory, monkeypatch, valid_teams):
     """Test if the team urns are collected correctly"""
-    mocker.patch(
-        "opendapi.validators.base.BaseValidator._get_file_contents_for_suffix",
-        return_value={
+    monkeypatch.setattr(
+        BaseValidator,
+        "_get_file_contents_for_suffix",
+        lambda self, suffixes: {
             f"{temp_directory}/my_company.teams.yaml": valid_teams,
         },
     )
@@ -22,11 +25,12 @@ def test_collect_teams_urn(temp_directory, mocker, valid_teams):
     ]
 
 
-def test_validate_parent_team_urn(temp_directory, mocker, valid_teams):
+def test_validate_parent_team_urn(temp_directory, monkeypatch, valid_teams):
     """Test if the parent team urn is validated correctly"""
-    mocker.patch(
-        "opendapi.validators.base.BaseValidator._get_file_contents_for_suffix",
-        return_value={
+    monkeypatch.setattr(
+        BaseValidator,
+        "_get_file_contents_for_suffix",
+        lambda self, suffixes: {
             f"{temp_directory}/my_company.teams.yaml": valid_teams,
         },
     )
@@ -38,13 +42,14 @@ def test_validate_parent_team_urn(temp_directory, mocker, valid_teams):
     ]
 
 
-def test_validate_parent_team_urn_fails(temp_directory, mocker, valid_teams):
+def test_validate_parent_team_urn_fails(temp_directory, monkeypatch, valid_teams):
     """Test if the parent team urn is validated correctly"""
-    invalid_teams = valid_teams.copy()
+    invalid_teams = copy.deepcopy(valid_teams)
     invalid_teams["teams"][0]["parent_team_urn"] = "company.team_c"
-    mocker.patch(
-        "opendapi.validators.base.BaseValidator._get_file_contents_for_suffix",
-        return_value={
+    monkeypatch.setattr(
+        BaseValidator,
+        "_get_file_contents_for_suffix",
+        lambda self, suffixes: {
             f"{temp_directory}/my_company.teams.yaml": invalid_teams,
         },
     )
@@ -0,0 +1,156 @@
+"""Tests for version_specs.py, run with `python -m unittest discover -s dev`"""
+
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+
+from version_specs import (
+  compare_content,
+  copy_specs_by_version,
+  extract_version_from_schema,
+)
+
+
+class ExtractVersionFromSchemaTest(unittest.TestCase):
+
+  def test_top_level_id(self):
+    schema = json.dumps({
+      "$schema": "http://json-schema.org/draft-07/schema#",
+      "$id": "https://opendapi.org/spec/0-0-1/dapi.json",
+    })
+    self.assertEqual(extract_version_from_schema(schema), "0-0-1")
+
+  def test_escaped_slashes_in_id(self):
+    schema = '{"$id": "https:\\/\\/opendapi.org\\/spec\\/0-0-1\\/dapi.json"}'
+    self.assertEqual(extract_version_from_schema(schema), "0-0-1")
+
+  def test_nested_id_before_top_level_id(self):
+    schema = json.dumps({
+      "$defs": {
+        "field": {"$id": "#field"},
+        "legacy": {"$id": "https://opendapi.org/spec/0-0-1/legacy.json"},
+      },
+      "$id": "https://opendapi.org/spec/0-0-2/dapi.json",
+    })
+    self.assertEqual(extract_version_from_schema(schema), "0-0-2")
+
+  def test_id_inside_a_string_value(self):
+    schema = json.dumps({
+      "description": 'Refer to it as {"$id": "https://opendapi.org/spec/9-9-9/dapi.json"}',
+      "$id": "https://opendapi.org/spec/0-0-3/dapi.json",
+    })
+    self.assertEqual(extract_version_from_schema(schema), "0-0-3")
+
+  def test_accepts_what_json_accepts(self):
+    # NaN and integers beyond 64 bits are valid JSON for the json module,
+    # which stricter parsers such as orjson reject or round
+    schema = (
+      '{"$id": "https://opendapi.org/spec/0-0-1/dapi.json",'
+      ' "maximum": 123456789012345678901234567890, "default": NaN}'
+    )
+    self.assertEqual(extract_version_from_schema(schema), "0-0-1")
+
+  def test_missing_id(self):
+    schema = json.dumps({"$defs": {"field": {"$id": "#field"}}})
+    self.assertIsNone(extract_version_from_schema(schema))
+
+
+class CompareContentTest(unittest.TestCase):
+
+  def test_full_diff_by_default(self):
+    src = "\n".join(str(i) for i in range(300))
+    dest = "\n".join(str(i * 2) for i in range(300))
+    diff = compare_content(src, dest).splitlines()
+    self.assertEqual(diff[0], "--- ")
+    self.assertFalse(any("not shown" in line for line in diff))
+
+  def test_truncated_diff_reports_dropped_lines(self):
+    src = "\n".join(str(i) for i in range(300))
+    dest = "\n".join(str(i * 2) for i in range(300))
+    full = compare_content(src, dest).splitlines()
+    diff = compare_content(src, dest, max_lines=10).splitlines()
+    self.assertEqual(diff[:10], full[:10])
+    self.assertEqual(diff[10:], [f"... {len(full) - 10} more diff lines not shown"])
+
+
+class CopySpecsByVersionTest(unittest.TestCase):
+
+  def setUp(self):
+    tmp_dir = tempfile.TemporaryDirectory()
+    self.addCleanup(tmp_dir.cleanup)
+    self.src_dir = os.path.join(tmp_dir.name, "spec")
+    self.dest_dir = os.path.join(tmp_dir.name, "docs", "spec")
+    os.makedirs(self.src_dir)
+    self.spec = json.dumps({
+      "$id": "https://opendapi.org/spec/0-0-1/dapi.json",
+      "type": "object",
+    }, indent=2) + "\n"
+    self.write(os.path.join(self.src_dir, "dapi.json"), self.spec)
+    self.dest_path = os.path.join(self.dest_dir, "0-0-1", "dapi.json")
+
+  def write(self, path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8", newline="") as file:
+      file.write(content)
+
+  def read(self, path):
+    with open(path, encoding="utf-8", newline="") as file:
+      return file.read()
+
+  def copy_specs(self, **kwargs):
+    # Run the copy, returning what it printed
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+      copy_specs_by_version(self.src_dir, self.dest_dir, **kwargs)
+    return output.getvalue()
+
+  def test_missing_destination_is_an_error(self):
+    with self.assertRaises(ValueError) as context:
+      self.copy_specs()
+    self.assertIn(f"Destination file {self.dest_path} does not exist.", str(context.exception))
+    self.assertFalse(os.path.exists(self.dest_path))
+
+  def test_missing_destination_is_copied(self):
+    output = self.copy_specs(ignore_missing=True)
+    self.assertEqual(output, f"Copied dapi.json to {self.dest_path}\n")
+    self.assertEqual(self.read(self.dest_path), self.spec)
+
+  def test_identical_destination_is_skipped(self):
+    self.write(self.dest_path, self.spec)
+    self.assertEqual(self.copy_specs(), "")
+    self.assertEqual(self.read(self.dest_path), self.spec)
+
+  def test_destination_with_other_line_endings_is_skipped(self):
+    crlf_spec = self.spec.replace("\n", "\r\n")
+    self.write(self.dest_path, crlf_spec)
+    self.assertEqual(self.copy_specs(), "")
+    self.assertEqual(self.read(self.dest_path), crlf_spec)
+
+  def test_mismatched_destination_is_reported_with_diff(self):
+    self.write(self.dest_path, self.spec.replace("object", "array"))
+    with self.assertRaises(ValueError) as context:
+      self.copy_specs()
+    message = str(context.exception)
+    self.assertIn("Content mismatch between", message)
+    self.assertIn('-  "type": "object"', message)
+    self.assertIn('+  "type": "array"', message)
+    self.assertNotEqual(self.read(self.dest_path), self.spec)
+
+  def test_allow_overwrite_replaces_mismatched_destination(self):
+    self.write(self.dest_path, self.spec.replace("object", "array"))
+    output = self.copy_specs(allow_overwrite=True)
+    self.assertEqual(output, f"Copied dapi.json to {self.dest_path}\n")
+    self.assertEqual(self.read(self.dest_path), self.spec)
+
+  def test_missing_version_is_an_error(self):
+    self.write(os.path.join(self.src_dir, "dapi.json"), "{}")
+    with self.assertRaises(ValueError) as context:
+      self.copy_specs(ignore_missing=True)
+    self.assertIn("Version missing in", str(context.exception))
+
+
+if __name__ == "__main__":
+  unittest.main()
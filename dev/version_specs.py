@@ -1,98 +1,148 @@
 """Python Script that copies jsonschema specs from specs/ to docs/spec grouped by version"""
 
 import os
-import shutil
 import re
+import sys
 import argparse
 import difflib
 import json
 
+# Version segment of a spec $id URL, e.g. /0-0-1/
+_VERSION_RE = re.compile(r'/(\d+-\d+-\d+)/')
+
 def extract_version_from_id(id_url):
   # Extract the version from the $id URL
-  match = re.search(r'/(\d+-\d+-\d+)/', id_url)
+  match = _VERSION_RE.search(id_url)
   if match:
     return match.group(1)
   return None
 
 def extract_version_from_schema(schema_data):
-  # Extract the version from the $id field in the schema
+  # Extract the version from the top-level $id field in the schema
   schema = json.loads(schema_data)
   if "$id" in schema:
     return extract_version_from_id(schema["$id"])
   return None
 
-def compare_content(src_content, dest_content):
-  # Create a unified diff between source and destination content
+def compare_content(src_content, dest_content, max_lines=None):
+  # Create a unified diff between source and destination content, keeping
+  # only the first max_lines lines (if set) and saying how many were dropped
   diff = difflib.unified_diff(src_content.splitlines(), dest_content.splitlines(), lineterm='')
-  return '\n'.join(diff)
-
-def copy_specs_by_version(src_dir, dest_dir, allow_overwrite=False, ignore_missing=False):
+  lines = list(diff)
+  if max_lines is not None and len(lines) > max_lines:
+    dropped = len(lines) - max_lines
+    lines[max_lines:] = [f"... {dropped} more diff lines not shown"]
+  return '\n'.join(lines)
+
+def normalize_newlines(text):
+  # Translate line endings the way a text-mode read does
+  return text.replace('\r\n', '\n').replace('\r', '\n')
+
+def copy_specs_by_version(
+  src_dir, dest_dir, allow_overwrite=False, ignore_missing=False, max_diff_lines=None
+):
   # Create the destination directory if it doesn't exist
-  if not os.path.exists(dest_dir):
-    os.makedirs(dest_dir)
+  os.makedirs(dest_dir, exist_ok=True)
 
   errors = []
+  copied = []
+  # Destination root with a trailing separator, so per-spec paths are
+  # plain concatenations rather than os.path.join calls
+  dest_prefix = os.path.join(dest_dir, '')
+  # Names of the files in each version directory, listed once when the
+  # directory is first seen so the per-spec checks need no stat calls
+  dest_index = {}
 
   # Iterate through the files in the source directory
-  for filename in os.listdir(src_dir):
-    if filename.endswith('.json'):
-      src_path = os.path.join(src_dir, filename)
-
-      with open(src_path, 'r') as file:
-        data = file.read()
-        # Extract version from $id
-        version = extract_version_from_schema(data)
-
-        if not version:
-          errors.append(f"Version missing in {src_path}")
-        else:
-          version_dir = os.path.join(dest_dir, version)
-          if not os.path.exists(version_dir):
-            os.makedirs(version_dir)
-
-          dest_path = os.path.join(version_dir, filename)
-
-          if not os.path.exists(dest_path) and not ignore_missing:
-            errors.append(f"Destination file {dest_path} does not exist.")
-
-          elif os.path.exists(dest_path) and not allow_overwrite:
-            with open(dest_path, 'r') as dest_file:
-              dest_data = dest_file.read()
-              if dest_data != data:
-                diff = compare_content(data, dest_data)
-                errors.append(
-                  f"Content mismatch between {src_path} and {dest_path}:\n"
-                  "  === Diff ===\n"
-                  f"{diff}"
-                  "Run version_specs.py with --allow-overwrite to overwrite destination files."
-                )
-          else:
-            shutil.copy(src_path, dest_path)
-            print(f"Copied {filename} to {dest_path}")
+  with os.scandir(src_dir) as entries:
+    spec_files = [
+      (entry.name, entry.path)
+      for entry in entries
+      if entry.name.endswith('.json') and entry.is_file()
+    ]
+
+  for filename, src_path in spec_files:
+    # Read the spec once; the bytes are copied as-is and the text is
+    # used to find the version and to diff against the destination
+    with open(src_path, 'rb') as file:
+      raw_data = file.read()
+    data = raw_data.decode('utf-8')
+    # Extract version from $id
+    version = extract_version_from_schema(data)
+
+    if not version:
+      errors.append(f"Version missing in {src_path}")
+      continue
+
+    version_dir = dest_prefix + version
+    if version_dir not in dest_index:
+      os.makedirs(version_dir, exist_ok=True)
+      with os.scandir(version_dir) as entries:
+        dest_index[version_dir] = {entry.name for entry in entries}
+    dest_exists = filename in dest_index[version_dir]
+
+    dest_path = version_dir + os.sep + filename
+
+    if not dest_exists and not ignore_missing:
+      errors.append(f"Destination file {dest_path} does not exist.")
+
+    elif dest_exists and not allow_overwrite:
+      with open(dest_path, 'rb') as dest_file:
+        dest_raw = dest_file.read()
+      # Compare bytes first and only decode the destination when they
+      # differ. Line endings alone are not a mismatch, as with the
+      # text-mode comparison this replaced
+      if dest_raw != raw_data:
+        dest_data = dest_raw.decode('utf-8')
+        if normalize_newlines(dest_data) != normalize_newlines(data):
+          diff = compare_content(data, dest_data, max_diff_lines)
+          errors.append(
+            f"Content mismatch between {src_path} and {dest_path}:\n"
+            "  === Diff ===\n"
+            f"{diff}"
+            "Run version_specs.py with --allow-overwrite to overwrite destination files."
+          )
+    else:
+      with open(dest_path, 'wb') as dest_file:
+        dest_file.write(raw_data)
+      copied.append(f"Copied {filename} to {dest_path}")
+
+  # Report the copies in a single write rather than one print per file
+  if copied:
+    sys.stdout.write("\n".join(copied) + "\n")
 
   if errors:
     raise ValueError("\n\n".join(errors))
 
 def list_files_in_markdown_file(dest_dir: str, markdown_file_name: str):
   """List the files in the destination directory to a markdown file"""
-  with open(os.path.join(dest_dir, markdown_file_name), 'w') as file:
-    file.write(
-      "---\n"
-      "layout: page\n"
-      "title: Spec\n"
-      "permalink: /spec/\n"
-      "---\n"
+  lines = [
+    "---\n"
+    "layout: page\n"
+    "title: Spec\n"
+    "permalink: /spec/\n"
+    "---\n",
+    "# OpenDAPI JSON Schema Specifications",
+    "\n\n",
+  ]
+  with os.scandir(dest_dir) as entries:
+    versions = sorted(
+      (entry for entry in entries if entry.is_dir()),
+      key=lambda entry: entry.name,
+      reverse=True,
     )
-    file.write("# OpenDAPI JSON Schema Specifications")
-    file.write("\n\n")
-    versions_list = os.listdir(dest_dir)
-    versions_list.sort(reverse=True)
-    for version in versions_list:
-      if os.path.isdir(os.path.join(dest_dir, version)):
-        file.write(f"## {version}\n\n")
-        for filename in os.listdir(os.path.join(dest_dir, version)):
-          if filename.endswith('.json'):
-            file.write(f"* [{filename}](./{version}/{filename})\n")
+  for version in versions:
+    lines.append(f"## {version.name}\n\n")
+    with os.scandir(version.path) as entries:
+      lines.extend(
+        f"* [{entry.name}](./{version.name}/{entry.name})\n"
+        for entry in entries
+        if entry.name.endswith('.json')
+      )
+
+  # Build the whole index first and write it out in one go
+  with open(os.path.join(dest_dir, markdown_file_name), 'w') as file:
+    file.write(''.join(lines))
 
 if __name__ == "__main__":
   parser = argparse.ArgumentParser(description="Copy JSON schema specs by version.")
@@ -100,6 +150,8 @@ if __name__ == "__main__":
                       help="Allow overwriting destination files if content differs.")
   parser.add_argument("--ignore-missing", action="store_true",
                       help="Ignore missing destination files.")
+  parser.add_argument("--max-diff-lines", type=int, default=None,
+                      help="Limit each reported diff to this many lines (default: no limit).")
   args = parser.parse_args()
 
   src_directory = "spec"
@@ -107,5 +159,7 @@ if __name__ == "__main__":
   allow_overwrite = args.allow_overwrite
   ignore_missing = args.ignore_missing
 
-  copy_specs_by_version(src_directory, dest_directory, allow_overwrite, ignore_missing)
+  copy_specs_by_version(
+    src_directory, dest_directory, allow_overwrite, ignore_missing, args.max_diff_lines
+  )
   list_files_in_markdown_file(dest_directory, "index.md")